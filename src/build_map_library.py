@@ -0,0 +1,65 @@
+import argparse
+import bootstrap
+from multiprocessing import Pool
+from core.map_library import FILE_SUFFIX, MapLibraryWriter
+from game._pathfinder import Pathfinder
+from terrain_map.generator import MapGenerator
+from config import config
+
+
+def library_entry_worker(seed: int):
+    """
+    Worker function to run in a process pool.
+    Generates a map and finds its initial path.
+    """
+    terrain_map = MapGenerator().generate(
+        width=config.MAP_WIDTH, height=config.MAP_HEIGHT, seed=seed
+    )
+    # Same start and end points as the game.
+    end = (config.MAP_WIDTH - 1, config.MAP_HEIGHT - 1)
+    initial_path = Pathfinder(terrain_map).find_path((0, 0), end)
+    return terrain_map, initial_path
+
+
+if __name__ == "__main__":
+    default_save_path = config.TERRAIN_SAVES_PATH / f"challenges{FILE_SUFFIX}"
+
+    parser = argparse.ArgumentParser(
+        description="Generate a library of maps and their initial paths."
+    )
+    parser.add_argument(
+        "filename",
+        nargs="?",
+        default=str(default_save_path),
+        help=f"The path to the output library. Defaults to: {default_save_path}",
+    )
+    parser.add_argument(
+        "--count", type=int, default=365, help="Number of maps. Defaults to 365."
+    )
+    parser.add_argument(
+        "--first-seed", type=int, default=0, help="First seed. Defaults to 0."
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Number of worker processes. Defaults to one per CPU.",
+    )
+    args = parser.parse_args()
+
+    MAP_WIDTH = config.MAP_WIDTH
+    MAP_HEIGHT = config.MAP_HEIGHT
+    seeds = range(args.first_seed, args.first_seed + args.count)
+
+    print(f"--- Building Map Library ({args.count} maps, {MAP_WIDTH}x{MAP_HEIGHT}) ---")
+    config.TERRAIN_SAVES_PATH.mkdir(parents=True, exist_ok=True)
+    with MapLibraryWriter(args.filename, MAP_WIDTH, MAP_HEIGHT) as writer:
+        with Pool(args.processes) as pool:
+            # Entries are written as they arrive, in seed order.
+            for i, (terrain_map, initial_path) in enumerate(
+                pool.imap(library_entry_worker, seeds), start=1
+            ):
+                writer.add(terrain_map, initial_path)
+                print(f"{i}/{args.count} seed={terrain_map.seed}", end="\r")
+
+    print(f"\nLibrary saved to {args.filename}")
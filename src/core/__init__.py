@@ -1,3 +1,4 @@
+from .worker_results import worker_results
 from .map_manager import map_manager
 
-__all__ = ["map_manager"]
+__all__ = ["map_manager", "worker_results"]
@@ -1,14 +1,17 @@
 import customtkinter as ctk
-from multiprocessing import Process, Queue
-from typing import Callable, cast
+from multiprocessing import Process
+from typing import TYPE_CHECKING, Callable, cast
 
 from ._pathfinder import Pathfinder
 from ._path import Path
 from terrain_map import TerrainMap
 
+if TYPE_CHECKING:
+    from core.worker_results import ResultChannel
+
 
 def find_path_worker(
-    queue: "Queue[tuple[Path, bool]]",
+    queue: "ResultChannel",
     terrain_map: TerrainMap,
     start: tuple[int, int],
     end: tuple[int, int],
@@ -17,7 +20,7 @@ def find_path_worker(
     """
     Worker function to run in a separate process.
     Calculates the path and puts the result (Path object and is_initial flag)
-    into the queue.
+    into the result channel.
     """
     pathfinder = Pathfinder(terrain_map)
     path_obj = pathfinder.find_path(start, end)
@@ -25,11 +28,9 @@ def find_path_worker(
 
 
 class GamePathManager:
-
-    # Interval to check for path calculation results
-    PATH_RESULT_INTERVAL = 100
-
     def __init__(self, start_point: tuple[int, int], end_point: tuple[int, int]):
+        from core.worker_results import worker_results
+
         self.root: ctk.CTk | None = None
         self.start_point = start_point
         self.end_point = end_point
@@ -40,14 +41,18 @@ class GamePathManager:
         self.current_path: Path = Path([], 0.0)
         self.current_cost: float = 0.0
 
-        # Queue for async path results
-        self.path_queue: "Queue[tuple[Path, bool]]" = Queue()
+        # Async path results, as (path, is_initial), delivered to the main
+        # loop as soon as a worker puts them.
+        self.path_results = worker_results.channel("path", self._on_path_result)
 
         # Callbacks for UI updates
         self.on_path_recalculated_callbacks: list[Callable[[Path], None]] = []
 
     def set_root(self, root: ctk.CTk):
+        from core.worker_results import worker_results
+
         self.root = root
+        worker_results.set_root(root)
 
     def add_on_path_recalculated_callback(self, callback: Callable[[Path], None]):
         self.on_path_recalculated_callbacks.append(callback)
@@ -56,6 +61,20 @@ class GamePathManager:
         """Calculates the path on the unmodified map and stores it as the "goal to beat"."""
         self._calculate_path(is_initial=True)
 
+    def set_initial_path(self, path_obj: Path):
+        """
+        Uses an already known path (e.g. from the map cache or the map
+        buffer) as the initial path, without running the pathfinder.
+        """
+        if not self.root:
+            raise RuntimeError("Root has not been set.")
+
+        self._set_path_loading()
+
+        # Delivered through the same channel as the worker's results, so the
+        # UI goes through the usual loading cycle.
+        self.path_results.put((path_obj, True))
+
     def recalculate_current_path(self):
         """Calculates the path on the *modified* map and checks for a win."""
         self._calculate_path(is_initial=False)
@@ -68,7 +87,6 @@ class GamePathManager:
             is_initial: If True, the result will be set as the initial path.
         """
         from core import map_manager
-        from state_managers import canvas_state_manager, game_state_manager
 
         if not self.root:
             raise RuntimeError("Root has not been set.")
@@ -76,21 +94,14 @@ class GamePathManager:
         if not map_manager.map:
             raise Exception("The map is not loaded.")
 
-        path_loading_var = cast(
-            ctk.BooleanVar, canvas_state_manager.vars["path_loading"]
-        )
-        path_loading_var.set(True)
-        player_can_interact_var = cast(
-            ctk.BooleanVar, game_state_manager.vars["player_can_interact"]
-        )
-        player_can_interact_var.set(False)
+        self._set_path_loading()
 
         current_map = map_manager.map
 
         process = Process(
             target=find_path_worker,
             args=(
-                self.path_queue,
+                self.path_results,
                 current_map,
                 self.start_point,
                 self.end_point,
@@ -99,19 +110,27 @@ class GamePathManager:
         )
         process.start()
 
-        self.root.after(self.PATH_RESULT_INTERVAL, self._check_for_path_result)
+    def _set_path_loading(self):
+        """Flags a path as loading and blocks player interaction meanwhile."""
+        from state_managers import canvas_state_manager, game_state_manager
 
-    def _check_for_path_result(self):
-        """Polls the queue for a generated path."""
-        if not self.path_queue.empty():
-            path_obj, is_initial = self.path_queue.get()
-            self._on_path_found(path_obj, is_initial)
-        else:
-            if self.root:
-                self.root.after(self.PATH_RESULT_INTERVAL, self._check_for_path_result)
+        path_loading_var = cast(
+            ctk.BooleanVar, canvas_state_manager.vars["path_loading"]
+        )
+        path_loading_var.set(True)
+        player_can_interact_var = cast(
+            ctk.BooleanVar, game_state_manager.vars["player_can_interact"]
+        )
+        player_can_interact_var.set(False)
+
+    def _on_path_result(self, result: tuple[Path, bool]):
+        """Receives a path from a worker, or a known one, on the main loop."""
+        path_obj, is_initial = result
+        self._on_path_found(path_obj, is_initial)
 
     def _on_path_found(self, path_obj: Path, is_initial: bool):
         """Processes the pathfinding result from the worker."""
+        from core import map_manager
         from state_managers import game_state_manager, canvas_state_manager
         from game import game_manager
 
@@ -128,6 +147,7 @@ class GamePathManager:
             cast(ctk.DoubleVar, game_state_manager.vars["initial_path_cost"]).set(
                 self.initial_cost
             )
+            map_manager.on_initial_path_found(path_obj)
         else:
             game_manager.judge_match()
 
@@ -18,8 +18,6 @@ class Pathfinder:
 
     def __init__(self, terrain_map: "TerrainMap"):
         self.terrain_map = terrain_map
-        self.width = terrain_map.width
-        self.height = terrain_map.height
 
     def _get_neighbors(self, pos: tuple[int, int]) -> list[tuple[int, int]]:
         """
@@ -35,7 +33,7 @@ class Pathfinder:
                 nx, ny = x + dx, y + dy
 
                 # Check bounds
-                if 0 <= nx < self.width and 0 <= ny < self.height:
+                if self.terrain_map.contains(nx, ny):
                     neighbors.append((nx, ny))
         return neighbors
 
@@ -65,6 +63,30 @@ class Pathfinder:
 
         return move_cost
 
+    def get_move_costs(self, nodes: list[tuple[int, int]]) -> np.ndarray:
+        """
+        Calculates the cost of every move along a path, as `_get_move_cost`
+        does, for all of its moves at once. Returns one cost per move, so
+        one fewer than there are nodes.
+        """
+        positions = np.asarray(nodes, dtype=np.float64).reshape(-1, 2)
+        heights = np.array(
+            [self.terrain_map.get_height_at(int(x), int(y)) for x, y in nodes],
+            dtype=np.float64,
+        )
+
+        delta_heights = np.diff(heights)
+        distances = np.hypot(*np.diff(positions, axis=0).T)
+
+        move_costs = distances * config.pathfinding.FLAT_MOVE_COST
+        # Only going uphill is penalized.
+        climbs = delta_heights > 0
+        gradients = delta_heights[climbs] / distances[climbs]
+        move_costs[climbs] += (
+            gradients * config.pathfinding.CLIMB_COST_MULTIPLIER
+        ) ** 2
+        return move_costs
+
     def _heuristic(self, pos: tuple[int, int], end_pos: tuple[int, int]) -> float:
         """
         Admissible heuristic for A*: Euclidean distance * minimum move cost.
@@ -101,17 +123,14 @@ class Pathfinder:
         # came_from[n] = node preceding n on the cheapest path
         came_from: dict[tuple[int, int], tuple[int, int]] = {}
 
-        # g_score[n] = cost of cheapest path from start to n
-        g_score: dict[tuple[int, int], float] = {
-            (x, y): float("inf") for x in range(self.width) for y in range(self.height)
-        }
-        g_score[start_pos] = 0.0
+        # g_score[n] = cost of cheapest path from start to n (infinite if
+        # n hasn't been reached yet)
+        g_score: dict[tuple[int, int], float] = {start_pos: 0.0}
 
         # f_score[n] = g_score[n] + heuristic(n, end)
         f_score: dict[tuple[int, int], float] = {
-            (x, y): float("inf") for x in range(self.width) for y in range(self.height)
+            start_pos: self._heuristic(start_pos, end_pos)
         }
-        f_score[start_pos] = self._heuristic(start_pos, end_pos)
 
         open_set_hash = {start_pos}  # For efficient "in open_set" checks
 
@@ -130,7 +149,7 @@ class Pathfinder:
                 move_cost = self._get_move_cost(current_pos, neighbor_pos)
                 tentative_g_score = g_score[current_pos] + move_cost
 
-                if tentative_g_score < g_score[neighbor_pos]:
+                if tentative_g_score < g_score.get(neighbor_pos, float("inf")):
                     # This path to neighbor is better than any previous one. Record it.
                     came_from[neighbor_pos] = current_pos
                     g_score[neighbor_pos] = tentative_g_score
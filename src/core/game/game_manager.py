@@ -59,6 +59,9 @@ class GameManager:
     def calculate_initial_path(self):
         self.path_manager.calculate_initial_path()
 
+    def set_initial_path(self, path: Path):
+        self.path_manager.set_initial_path(path)
+
     def use_tool_at(self, tool_type: str, x: int, y: int):
         """
         Public method called by the UI when the player clicks on the map.
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import zipfile
+import numpy as np
+from pathlib import Path as FilePath
+from terrain_map import TerrainMap, precision
+from terrain_map.generator.generator_config import generator_config_hash
+from game._path import Path
+
+
+class MapCache:
+    """
+    A persistent, size-bounded cache of generated maps.
+
+    Each entry holds a generated heightmap together with its initial path
+    and cost, stored as a compressed .npz file. Entries are keyed by seed,
+    map size and a hash of generator_config.json and the heightfield storage
+    dtype, so changing either never serves stale maps. When the cache grows
+    past `max_bytes`, the least recently used entries are evicted.
+    """
+
+    FILE_SUFFIX = ".npz"
+
+    def __init__(self, directory: FilePath, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._config_hash: str | None = None
+
+    @property
+    def config_hash(self) -> str:
+        """A short hash of the generator configuration and storage dtype."""
+        if self._config_hash is None:
+            config_hash = generator_config_hash() + precision.storage_dtype().str
+            self._config_hash = hashlib.sha1(config_hash.encode()).hexdigest()[:12]
+        return self._config_hash
+
+    def _entry_path(self, seed: int, width: int, height: int) -> FilePath:
+        file_name = f"{seed}_{width}x{height}_{self.config_hash}{self.FILE_SUFFIX}"
+        return self.directory / file_name
+
+    def load(
+        self, seed: int, width: int, height: int
+    ) -> tuple[TerrainMap, Path] | None:
+        """
+        Returns the cached map and its initial path for the given seed and
+        size, or None if there is no usable entry.
+        """
+        entry_path = self._entry_path(seed, width, height)
+        if not entry_path.exists():
+            return None
+
+        try:
+            with np.load(entry_path) as entry:
+                height_data = entry["height_data"]
+                path_nodes = [(int(x), int(y)) for x, y in entry["path_nodes"]]
+                path_cost = float(entry["path_cost"])
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            print(f"Discarding unreadable map cache entry {entry_path}: {e}")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        # Bump the modification time, which is what the LRU eviction uses.
+        os.utime(entry_path)
+
+        return TerrainMap(height_data, seed=seed), Path(path_nodes, path_cost)
+
+    def store(
+        self, terrain_map: TerrainMap, initial_path: Path, width: int, height: int
+    ):
+        """
+        Stores a freshly generated map and its initial path under the size
+        it was generated with.
+        """
+        if terrain_map.seed is None:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry_path = self._entry_path(terrain_map.seed, width, height)
+        # The map is unmodified, so its stored form is lossless.
+        height_data = precision.to_storage(terrain_map.height_data)
+        path_nodes = np.array(initial_path.nodes, dtype=np.int32).reshape(-1, 2)
+
+        # Write to a temporary file first so a crash never leaves a
+        # half-written entry behind.
+        temp_path = entry_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                height_data=height_data,
+                path_nodes=path_nodes,
+                path_cost=np.float64(initial_path.total_cost),
+            )
+        os.replace(temp_path, entry_path)
+
+        self._evict()
+
+    def _evict(self):
+        """Deletes the least recently used entries until under the size budget."""
+        entries = []
+        for entry_path in self.directory.glob(f"*{self.FILE_SUFFIX}"):
+            stat = entry_path.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_bytes -= size
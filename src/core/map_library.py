@@ -0,0 +1,201 @@
+import os
+import struct
+import numpy as np
+from pathlib import Path as FilePath
+from terrain_map import TerrainMap, precision
+from terrain_map.generator.generator_config import generator_config_hash
+from game._path import Path
+
+# A library file holds a fixed-size header, the entries one after another
+# (the heights as a raw array in the storage dtype, followed by the initial
+# path nodes as int32 (x, y) pairs, padded to ENTRY_ALIGNMENT bytes) and an
+# index of the entries at the end.
+MAGIC = b"GRADLIB\x00"
+VERSION = 1
+# magic, version, dtype, width, height, entry count, index offset, config hash
+HEADER_FORMAT = "<8sH4sIIQQ12s"
+HEADER_SIZE = 64
+ENTRY_ALIGNMENT = 8
+FILE_SUFFIX = ".tlib"
+
+INDEX_DTYPE = np.dtype(
+    [
+        ("seed", "<i8"),
+        ("offset", "<u8"),
+        ("initial_cost", "<f8"),
+        ("path_length", "<u4"),
+        ("padding", "<u4"),
+    ]
+)
+NODE_DTYPE = np.dtype("<i4")
+
+
+class MapLibrary:
+    """
+    A read-only archive of pre-generated maps and their initial paths,
+    such as a curated set of challenge maps.
+
+    The whole file is memory-mapped and the index is read into a dictionary
+    from seed to entry, so any entry is found in constant time and only the
+    pages holding it are ever read from disk.
+    """
+
+    def __init__(self, filepath: str | FilePath):
+        self.filepath = FilePath(filepath)
+        self._data = np.memmap(self.filepath, dtype=np.uint8, mode="r")
+
+        if len(self._data) < HEADER_SIZE or bytes(self._data[:8]) != MAGIC:
+            raise ValueError("Not a map library.")
+        _, version, dtype, width, height, count, index_offset, config_hash = (
+            struct.unpack_from(HEADER_FORMAT, self._data)
+        )
+        if version > VERSION:
+            raise ValueError(
+                f"Map library version {version} is newer than the supported {VERSION}."
+            )
+
+        self.dtype = np.dtype(dtype.rstrip(b"\x00").decode())
+        self.width = width
+        self.height = height
+        self.config_hash = config_hash.rstrip(b"\x00").decode()
+
+        index_end = index_offset + count * INDEX_DTYPE.itemsize
+        if index_end > len(self._data):
+            raise ValueError("Map library is truncated.")
+        self.index = self._data[index_offset:index_end].view(INDEX_DTYPE)
+        self._positions = {int(seed): i for i, seed in enumerate(self.index["seed"])}
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, seed: int) -> bool:
+        return seed in self._positions
+
+    @property
+    def seeds(self) -> list[int]:
+        """The seeds of the entries, in the order they were added."""
+        return [int(seed) for seed in self.index["seed"]]
+
+    def is_compatible(self, width: int, height: int) -> bool:
+        """
+        Whether the library holds maps of the given size, generated with the
+        current generator config. Initial paths depend on both.
+        """
+        same_size = (self.width, self.height) == (width, height)
+        return same_size and self.config_hash == generator_config_hash()
+
+    @property
+    def map_bytes(self) -> int:
+        return self.width * self.height * self.dtype.itemsize
+
+    def height_data(self, seed: int) -> np.ndarray:
+        """
+        Returns a read-only view of the stored heights of an entry, without
+        copying them. Batch tools can iterate over the library this way.
+        """
+        offset = int(self.index[self._positions[seed]]["offset"])
+        heights = self._data[offset : offset + self.map_bytes]
+        return heights.view(self.dtype).reshape(self.height, self.width)
+
+    def initial_path_nodes(self, seed: int) -> np.ndarray:
+        """Returns a read-only (path length, 2) view of an entry's path."""
+        entry = self.index[self._positions[seed]]
+        offset = int(entry["offset"]) + self.map_bytes
+        node_bytes = int(entry["path_length"]) * 2 * NODE_DTYPE.itemsize
+        nodes = self._data[offset : offset + node_bytes]
+        return nodes.view(NODE_DTYPE).reshape(-1, 2)
+
+    def load(self, seed: int) -> tuple[TerrainMap, Path] | None:
+        """
+        Returns the map and initial path stored for a seed, or None if the
+        library doesn't hold it.
+        """
+        if seed not in self._positions:
+            return None
+
+        entry = self.index[self._positions[seed]]
+        terrain_map = TerrainMap(np.asarray(self.height_data(seed)), seed=seed)
+        nodes = [(int(x), int(y)) for x, y in self.initial_path_nodes(seed)]
+        return terrain_map, Path(nodes, float(entry["initial_cost"]))
+
+
+class MapLibraryWriter:
+    """
+    Writes a map library one entry at a time, so building a library never
+    needs more than one map in memory. Use it as a context manager; the
+    library only replaces `filepath` once every entry has been written.
+    """
+
+    def __init__(self, filepath: str | FilePath, width: int, height: int):
+        self.filepath = FilePath(filepath)
+        self.width = width
+        self.height = height
+        self.dtype = precision.storage_dtype()
+        self._entries: list[tuple[int, int, float, int, int]] = []
+        self._seeds: set[int] = set()
+        self._temp_path = self.filepath.with_suffix(".tmp")
+        self._file = None
+
+    def __enter__(self) -> "MapLibraryWriter":
+        self._file = open(self._temp_path, "wb")
+        # The header is only known at the end, so its space is reserved.
+        self._file.write(b"\x00" * HEADER_SIZE)
+        return self
+
+    def add(self, terrain_map: TerrainMap, initial_path: Path):
+        """Appends a map and its initial path to the library."""
+        if self._file is None:
+            raise RuntimeError("MapLibraryWriter must be used as a context manager.")
+        if terrain_map.seed is None:
+            raise ValueError("Only maps with a seed can be added to a library.")
+        if terrain_map.seed in self._seeds:
+            raise ValueError(f"Seed {terrain_map.seed} is already in the library.")
+        if (terrain_map.width, terrain_map.height) != (self.width, self.height):
+            raise ValueError(
+                f"Map is {terrain_map.width}x{terrain_map.height}, but the library "
+                f"holds {self.width}x{self.height} maps."
+            )
+
+        offset = self._file.tell()
+        precision.to_storage(terrain_map.height_data).tofile(self._file)
+        nodes = np.array(initial_path.nodes, dtype=NODE_DTYPE).reshape(-1, 2)
+        nodes.tofile(self._file)
+        self._file.write(b"\x00" * (-self._file.tell() % ENTRY_ALIGNMENT))
+
+        self._entries.append(
+            (terrain_map.seed, offset, initial_path.total_cost, len(nodes), 0)
+        )
+        self._seeds.add(terrain_map.seed)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        assert self._file is not None
+        try:
+            if exc_type is None:
+                self._write_index_and_header()
+        finally:
+            self._file.close()
+            self._file = None
+
+        if exc_type is None:
+            os.replace(self._temp_path, self.filepath)
+        else:
+            self._temp_path.unlink(missing_ok=True)
+
+    def _write_index_and_header(self):
+        assert self._file is not None
+        index_offset = self._file.tell()
+        np.array(self._entries, dtype=INDEX_DTYPE).tofile(self._file)
+
+        header = struct.pack(
+            HEADER_FORMAT,
+            MAGIC,
+            VERSION,
+            self.dtype.str.encode(),
+            self.width,
+            self.height,
+            len(self._entries),
+            index_offset,
+            generator_config_hash().encode(),
+        )
+        self._file.seek(0)
+        self._file.write(header.ljust(HEADER_SIZE, b"\x00"))
@@ -1,38 +1,113 @@
 import json
-import numpy as np
+import os
 import importlib.resources
+from datetime import date
 from terrain_map.generator import MapGenerator
-from terrain_map import TerrainMap
+from terrain_map import TerrainMap, map_file, dem
 from config import config
-from multiprocessing import Process, Queue
+from .map_cache import MapCache
+from .map_library import MapLibrary
+from .worker_results import worker_results, ResultChannel
+from collections import deque
+from multiprocessing import Process
 from typing import TYPE_CHECKING, cast
 import customtkinter as ctk
 import matplotlib.pyplot as plt
 
 if TYPE_CHECKING:
     from terrain_map.generator.map_generator import MapGenerator
+    from game._path import Path
 
 
-def generate_map_worker(queue: Queue, seed: int | None = None):
-    """Worker function to run in a separate process."""
+def generate_map_worker(queue: ResultChannel, seed: int | None = None):
+    """
+    Worker function to run in a separate process.
+    Puts a low-resolution preview of the map on the queue at every level of
+    detail, followed by the full map, each as (terrain_map, is_preview).
+    """
     generator = MapGenerator()
-    terrain_map = generator.generate(
-        width=config.MAP_WIDTH, height=config.MAP_HEIGHT, seed=seed
+    strides = generator.PREVIEW_STRIDES
+    levels = generator.generate_progressive(
+        width=config.MAP_WIDTH, height=config.MAP_HEIGHT, seed=seed, strides=strides
     )
-    queue.put(terrain_map)
+    for stride, terrain_map in zip(strides, levels):
+        queue.put((terrain_map, stride != 1))
+
+
+def load_dem_worker(queue: ResultChannel, filepath: str, fit: str):
+    """
+    Worker function to run in a separate process.
+    Streams an elevation model into a map of the configured size and puts it
+    on the queue as (terrain_map, False), or (None, False) if it can't be read.
+    """
+    try:
+        terrain_map = dem.load_dem(
+            filepath, config.MAP_WIDTH, config.MAP_HEIGHT, fit=fit
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error loading elevation model from {filepath}: {e}")
+        terrain_map = None
+    queue.put((terrain_map, False))
+
+
+def pregenerate_map_worker(
+    queue: ResultChannel,
+    start: tuple[int, int],
+    end: tuple[int, int],
+):
+    """
+    Worker function to run in a low-priority background process.
+    Generates a random map and its initial path ahead of time.
+    """
+    from game._pathfinder import Pathfinder
+
+    # Yield the CPU to the game and to any map the player is waiting for.
+    if hasattr(os, "nice"):
+        os.nice(config.MAP_BUFFER.WORKER_NICENESS)
 
+    generator = MapGenerator()
+    terrain_map = generator.generate(width=config.MAP_WIDTH, height=config.MAP_HEIGHT)
+    initial_path = Pathfinder(terrain_map).find_path(start, end)
+    queue.put((terrain_map, initial_path))
 
-class MapManager:
-    MAP_RESULT_INTERVAL = 100
 
+class MapManager:
     def __init__(self):
         self.generator = MapGenerator()
         self._map: "TerrainMap | None" = None
         self.root: "ctk.CTk | None" = None
-        self.result_queue: "Queue[TerrainMap]" = Queue()
+        # Previews and final maps, as (terrain_map, is_preview), delivered to
+        # the main loop as soon as a worker puts them.
+        self.map_results = worker_results.channel("map", self._on_map_result)
+
+        self.cache = MapCache(
+            config.TERRAIN_SAVES_PATH / "cache",
+            max_bytes=int(config.MAP_CACHE.MAX_SIZE_MB * 1024 * 1024),
+        )
+        # Curated maps with their initial paths, opened on first use. A
+        # library that can't be used is only reported once.
+        self._map_library: MapLibrary | None = None
+        self._map_library_checked = False
+
+        # Maps generated ahead of time, each with its initial path already
+        # computed, so starting a new random game doesn't wait on either.
+        self.map_buffer: "deque[tuple[TerrainMap, Path]]" = deque()
+        self.pregenerated_maps = worker_results.channel(
+            "pregenerated_map", self._on_pregenerated_map
+        )
+        self._pregeneration_process: Process | None = None
+
+        # Initial path of the map being loaded, when it is already known
+        # (cached or pre-generated maps).
+        self._known_initial_path: "Path | None" = None
+        # Whether the map being loaded should be stored in the cache.
+        self._pending_map_is_cacheable = False
+        # Whether the current map is fresh from the generator and unmodified.
+        self._map_is_cacheable = False
 
         self._on_map_recreate_callbacks = []
         self._on_map_change_callbacks = []
+        self._on_map_preview_callbacks = []
 
     @property
     def map(self):
@@ -46,6 +121,7 @@ class MapManager:
 
     def set_root(self, root: ctk.CTk):
         self.root = root
+        worker_results.set_root(root)
 
     def add_map_recreate_callback(self, callback):
         self._on_map_recreate_callbacks.append(callback)
@@ -53,6 +129,13 @@ class MapManager:
     def add_map_change_callback(self, callback):
         self._on_map_change_callbacks.append(callback)
 
+    def add_map_preview_callback(self, callback):
+        """
+        Registers a callback receiving low-resolution previews of the map
+        being generated, coarsest first.
+        """
+        self._on_map_preview_callbacks.append(callback)
+
     def recreate_map(self, seed: int | None = None):
         from state_managers import canvas_state_manager
 
@@ -62,11 +145,156 @@ class MapManager:
         map_loading_var = cast(ctk.BooleanVar, canvas_state_manager.vars["map_loading"])
         map_loading_var.set(True)
 
-        process = Process(target=generate_map_worker, args=(self.result_queue, seed))
+        cached = self._load_from_library(seed) or self._load_from_cache(seed)
+        if cached is not None:
+            ready_map = cached
+            self._pending_map_is_cacheable = False
+        elif seed is None and self.map_buffer:
+            ready_map = self.map_buffer.popleft()
+            self._pending_map_is_cacheable = True
+        else:
+            ready_map = None
+            self._pending_map_is_cacheable = True
+
+        if ready_map is not None:
+            # Delivered through the same channel as the worker's result, so
+            # the loading flow is the same whether the map was ready or not.
+            terrain_map, self._known_initial_path = ready_map
+            self.map_results.put((terrain_map, False))
+        else:
+            self._known_initial_path = None
+            process = Process(target=generate_map_worker, args=(self.map_results, seed))
+            process.start()
+
+    def load_map_from_dem(self, filepath: str, fit: str = "resample"):
+        """
+        Replaces the current map with real terrain from an elevation model
+        (a `.npy` array or a 16-bit grayscale PNG), fitted to the map size
+        by resampling or cropping. The file is read in a separate process
+        and the map then goes through the same loading flow as a new one.
+        """
+        from state_managers import canvas_state_manager
+
+        if self.root is None:
+            raise RuntimeError("MapManager's root has not been set.")
+
+        map_loading_var = cast(ctk.BooleanVar, canvas_state_manager.vars["map_loading"])
+        map_loading_var.set(True)
+
+        self._known_initial_path = None
+        self._pending_map_is_cacheable = False
+        process = Process(
+            target=load_dem_worker, args=(self.map_results, filepath, fit)
+        )
         process.start()
 
-        # Poll for the result from the separate process.
-        self.root.after(self.MAP_RESULT_INTERVAL, self._check_for_map_result)
+    @property
+    def map_library(self) -> MapLibrary | None:
+        """
+        The map library in the terrain saves folder, if there is one. A
+        library built for another map size or generator config is ignored,
+        so maps come from the cache or the generator instead.
+        """
+        if self._map_library is None and not self._map_library_checked:
+            filepath = config.TERRAIN_SAVES_PATH / config.MAP_LIBRARY.FILENAME
+            if filepath.exists():
+                self._map_library_checked = True
+                self._map_library = self._open_map_library(filepath)
+        return self._map_library
+
+    @staticmethod
+    def _open_map_library(filepath) -> MapLibrary | None:
+        try:
+            library = MapLibrary(filepath)
+        except (OSError, ValueError) as e:
+            print(f"Error opening map library {filepath}: {e}")
+            return None
+
+        if not library.is_compatible(config.MAP_WIDTH, config.MAP_HEIGHT):
+            print(
+                f"Map library {filepath} holds {library.width}x{library.height} "
+                f"maps for generator config {library.config_hash}, which don't "
+                "match the current settings. It is ignored."
+            )
+            return None
+        return library
+
+    def daily_challenge_seed(self, day: date | None = None) -> int | None:
+        """
+        Returns the seed of the library map for a day (today by default),
+        or None if there is no usable map library.
+        """
+        library = self.map_library
+        if not library:
+            return None
+
+        day = day or date.today()
+        return library.seeds[day.toordinal() % len(library)]
+
+    def _load_from_library(self, seed: int | None):
+        """Looks the requested seed up in the map library."""
+        library = self.map_library
+        if seed is None or library is None:
+            return None
+
+        return library.load(seed)
+
+    def _load_from_cache(self, seed: int | None):
+        """Looks the requested seed up in the map cache."""
+        if seed is None or not config.MAP_CACHE.ENABLED:
+            return None
+
+        return self.cache.load(seed, config.MAP_WIDTH, config.MAP_HEIGHT)
+
+    def on_initial_path_found(self, initial_path: "Path"):
+        """
+        Called once the initial path of a new map is known. Freshly generated
+        maps are saved to the cache together with that path, and the map
+        buffer starts refilling now that the player's map is ready.
+        """
+        self._store_in_cache(initial_path)
+        self._fill_map_buffer()
+
+    def _store_in_cache(self, initial_path: "Path"):
+        if not self._map_is_cacheable or not config.MAP_CACHE.ENABLED:
+            return
+
+        self._map_is_cacheable = False
+        try:
+            self.cache.store(
+                self.map, initial_path, config.MAP_WIDTH, config.MAP_HEIGHT
+            )
+        except OSError as e:
+            print(f"Error storing map in cache: {e}")
+
+    def _fill_map_buffer(self):
+        """
+        Starts pre-generating one more map in the background, unless the
+        buffer is already full or a map is being pre-generated.
+        """
+        from game import game_manager
+
+        if self.root is None or self._pregeneration_process is not None:
+            return
+        if len(self.map_buffer) >= config.MAP_BUFFER.SIZE:
+            return
+
+        self._pregeneration_process = Process(
+            target=pregenerate_map_worker,
+            args=(
+                self.pregenerated_maps,
+                game_manager.start_point,
+                game_manager.end_point,
+            ),
+            daemon=True,
+        )
+        self._pregeneration_process.start()
+
+    def _on_pregenerated_map(self, pregenerated: "tuple[TerrainMap, Path]"):
+        """Receives a map generated in the background, with its initial path."""
+        self.map_buffer.append(pregenerated)
+        self._pregeneration_process = None
+        self._fill_map_buffer()
 
     def _on_map_generated(self, terrain_map: TerrainMap):
         # Local imports to avoid circular dependencies.
@@ -75,6 +303,9 @@ class MapManager:
         from game import game_manager
 
         self.map = terrain_map
+        known_initial_path = self._known_initial_path
+        self._known_initial_path = None
+        self._map_is_cacheable = self._pending_map_is_cacheable
 
         seed_var = cast(ctk.StringVar, game_state_manager.vars["current_seed"])
         seed_text = str(terrain_map.seed) if terrain_map.seed is not None else "N/A"
@@ -83,19 +314,32 @@ class MapManager:
         for callback in self._on_map_recreate_callbacks:
             callback()
 
-        game_manager.calculate_initial_path()
+        if known_initial_path is not None:
+            game_manager.set_initial_path(known_initial_path)
+        else:
+            game_manager.calculate_initial_path()
 
         map_loading_var = cast(ctk.BooleanVar, canvas_state_manager.vars["map_loading"])
         map_loading_var.set(False)
 
-    def _check_for_map_result(self):
-        """Polls the queue for a generated map."""
-        if not self.result_queue.empty():
-            terrain_map = self.result_queue.get()
+    def _on_map_result(self, result: "tuple[TerrainMap | None, bool]"):
+        """Receives a preview or the final map from a map worker."""
+        from state_managers import canvas_state_manager
+
+        terrain_map, is_preview = result
+        if terrain_map is None:
+            # The map couldn't be loaded, so the current one is kept.
+            map_loading_var = cast(
+                ctk.BooleanVar, canvas_state_manager.vars["map_loading"]
+            )
+            map_loading_var.set(False)
+            return
+        if not is_preview:
             self._on_map_generated(terrain_map)
-        else:
-            if self.root:
-                self.root.after(self.MAP_RESULT_INTERVAL, self._check_for_map_result)
+            return
+
+        for callback in self._on_map_preview_callbacks:
+            callback(terrain_map)
 
     def load_map_from_json(self, filepath: str | None = None):
         """Loads a terrain map from a JSON file and sets it as the current map."""
@@ -106,22 +350,35 @@ class MapManager:
                     / "terrain_saves"
                     / "terrain_map.json"
                 )
-            with open(
-                filepath, "r"
-            ) as f:  # Not using importlib.resources.open_text as we need the filepath
-                map_data = json.load(f)
+            # Not using importlib.resources.open_text as we need the filepath
+            self._set_loaded_map(map_file.load_map_json(filepath), filepath)
 
-            height_data = np.array(map_data["height_data"], dtype=np.uint8)
+        except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
+            print(f"Error loading map from {filepath}: {e}")
 
-            self.map = TerrainMap(height_data, seed=map_data.get("seed"))
+    def load_map_from_file(self, filepath: str | None = None):
+        """
+        Loads a terrain map from a binary map file and sets it as the current
+        map. The heights are memory-mapped rather than parsed.
+        """
+        if filepath is None:
+            filepath = str(
+                config.TERRAIN_SAVES_PATH / f"terrain_map{map_file.FILE_SUFFIX}"
+            )
 
-            print(f"Successfully loaded map from {filepath}")
+        try:
+            self._set_loaded_map(map_file.load_map(filepath), filepath)
+        except (OSError, ValueError) as e:
+            print(f"Error loading map from {filepath}: {e}")
 
-            for callback in self._on_map_recreate_callbacks:
-                callback()
+    def _set_loaded_map(self, terrain_map: TerrainMap, filepath: str):
+        self.map = terrain_map
+        self._map_is_cacheable = False
 
-        except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
-            print(f"Error loading map from {filepath}: {e}")
+        print(f"Successfully loaded map from {filepath}")
+
+        for callback in self._on_map_recreate_callbacks:
+            callback()
 
     def apply_tool(self, tool_type: str, center_x: int, center_y: int) -> bool:
         successful_mod = self.map.apply_tool(tool_type, center_x, center_y)
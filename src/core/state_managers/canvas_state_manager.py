@@ -11,10 +11,15 @@ class CanvasStateManager(StateManager):
         self._initialize_state(
             {
                 "zoom": ctk.DoubleVar(value=1.0),
-                "initial_zoom": ctk.IntVar(value=1),
+                "initial_zoom": ctk.DoubleVar(value=1.0),
+                # The range of zooms the canvas allows, set with initial_zoom.
+                "min_zoom": ctk.DoubleVar(value=1.0),
+                "max_zoom": ctk.DoubleVar(value=1.0),
                 "map_loading": ctk.BooleanVar(value=False),
                 "path_loading": ctk.BooleanVar(value=False),
                 "hovered_gradient": ctk.StringVar(value="#FF0000"),
+                "show_path_costs": ctk.BooleanVar(value=False),
+                "show_steepness": ctk.BooleanVar(value=False),
             }
         )
 
@@ -0,0 +1,85 @@
+import threading
+import time
+import tkinter
+from multiprocessing import Queue
+from typing import Any, Callable
+import customtkinter as ctk
+
+
+class ResultChannel:
+    """
+    The sending end of one channel of WorkerResults. It can be passed to a
+    worker process and has the same `put` as a Queue.
+    """
+
+    def __init__(self, queue: "Queue[tuple[str, Any]]", name: str):
+        self.queue = queue
+        self.name = name
+
+    def put(self, result: Any):
+        self.queue.put((self.name, result))
+
+
+class WorkerResults:
+    """
+    Delivers the results of worker processes to the Tk main loop the moment
+    they arrive.
+
+    Every worker puts its results on one queue, through a named channel. A
+    single dispatcher thread blocks on that queue and schedules the callback
+    of the channel on the main loop for each result. Nothing polls, so there
+    is no added latency and no wakeup while no job is running.
+    """
+
+    # How long the dispatcher waits for the main loop to start, if a result
+    # arrives before it does.
+    MAINLOOP_RETRY_INTERVAL = 0.05
+
+    def __init__(self):
+        self.queue: "Queue[tuple[str, Any]]" = Queue()
+        self.root: ctk.CTk | None = None
+        self._callbacks: dict[str, Callable[[Any], None]] = {}
+        self._dispatcher: threading.Thread | None = None
+
+    def set_root(self, root: ctk.CTk):
+        """Sets the main loop results are delivered to and starts dispatching."""
+        self.root = root
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(
+                target=self._dispatch, name="worker-results", daemon=True
+            )
+            self._dispatcher.start()
+
+    def channel(self, name: str, callback: Callable[[Any], None]) -> ResultChannel:
+        """
+        Returns the channel with the given name, whose results are passed to
+        `callback` on the main loop.
+        """
+        self._callbacks[name] = callback
+        return ResultChannel(self.queue, name)
+
+    def _dispatch(self):
+        """Runs on the dispatcher thread until the app is closed."""
+        while True:
+            name, result = self.queue.get()
+            if not self._post(self._callbacks[name], result):
+                return
+
+    def _post(self, callback: Callable[[Any], None], result: Any) -> bool:
+        """
+        Schedules a callback on the main loop, which Tk allows from other
+        threads. Returns False once the app has been closed.
+        """
+        assert self.root is not None
+        while True:
+            try:
+                self.root.after(0, callback, result)
+                return True
+            except RuntimeError:
+                # The main loop hasn't started yet.
+                time.sleep(self.MAINLOOP_RETRY_INTERVAL)
+            except tkinter.TclError:
+                return False
+
+
+worker_results = WorkerResults()
@@ -1,18 +1,22 @@
 import argparse
+from terrain_map import map_file
 from terrain_map.generator import MapGenerator
 from config import config
 
 if __name__ == "__main__":
-    default_save_path = config.TERRAIN_SAVES_PATH / "terrain_map.json"
+    default_save_path = config.TERRAIN_SAVES_PATH / f"terrain_map{map_file.FILE_SUFFIX}"
 
     parser = argparse.ArgumentParser(
-        description="Generate a terrain map and save it to a JSON file."
+        description=(
+            "Generate a terrain map and save it to a binary map file, or export "
+            "it to JSON if the filename ends in .json."
+        )
     )
     parser.add_argument(
         "filename",
         nargs="?",
         default=str(default_save_path),
-        help=f"The path to the output JSON file. Defaults to: {default_save_path}",
+        help=f"The path to the output file. Defaults to: {default_save_path}",
     )
     args = parser.parse_args()
 
@@ -21,12 +25,14 @@ if __name__ == "__main__":
 
     print(f"--- Generating Terrain Map ({MAP_WIDTH}x{MAP_HEIGHT}) ---")
     generator = MapGenerator()
-    # We only need the terrain_map object for saving, so we ignore the attenuation_mask
-    terrain_map, _ = generator.generate(width=MAP_WIDTH, height=MAP_HEIGHT)
-    print(
-        f"Map generated. Shelter location: (x={terrain_map.get_shelter_coords()[0]}, y={terrain_map.get_shelter_coords()[1]})"
-    )
+    terrain_map = generator.generate(width=MAP_WIDTH, height=MAP_HEIGHT)
+    print(f"Map generated with seed {terrain_map.seed}.")
 
-    terrain_map.save_to_json(args.filename)
+    config.TERRAIN_SAVES_PATH.mkdir(parents=True, exist_ok=True)
+    if args.filename.endswith(".json"):
+        map_file.save_map_json(terrain_map, args.filename)
+    else:
+        map_file.save_map(terrain_map, args.filename)
+    print(f"Map saved to {args.filename}")
 
     print("\nScript finished.")
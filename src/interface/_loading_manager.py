@@ -1,18 +1,33 @@
 import customtkinter as ctk
-from typing import Dict, Callable, Optional
+from PIL import Image
+from typing import Dict, Callable, Optional, TYPE_CHECKING
 from interface.components.loading_frame import LoadingFrame
+from interface._terrain_colors import colorize_terrain
+
+if TYPE_CHECKING:
+    from terrain_map import TerrainMap
 
 
 class LoadingManager:
-    """Manages the display of one or more loading indicators."""
+    """
+    Manages the display of one or more loading indicators.
+
+    Loaders in BLOCKING_LOADERS (a new map) hide the canvas behind a centered
+    indicator. Any other loader (a path being calculated) runs in the
+    background: the canvas stays visible and pannable, with a compact
+    indicator over its top edge.
+    """
+
+    BLOCKING_LOADERS = ("map",)
+    BACKGROUND_INDICATOR_MARGIN = 12
 
     def __init__(
         self,
         parent: ctk.CTkFrame,
-        on_load_finish_callback: Callable[[], None],
+        on_canvas_ready_callback: Callable[[], None],
     ):
         self.parent = parent
-        self.on_load_finish_callback = on_load_finish_callback
+        self.on_canvas_ready_callback = on_canvas_ready_callback
         self.canvas_to_manage: Optional[ctk.CTkCanvas] = None
 
         self.loading_frames: Dict[str, LoadingFrame] = {}
@@ -36,15 +51,36 @@ class LoadingManager:
 
         self._update_loading_state()
 
+    def show_map_preview(self, terrain_map: "TerrainMap"):
+        """Shows a low-resolution preview of the map being generated."""
+        frame = self.loading_frames.get("map")
+        if frame is None:
+            return
+
+        image_data = colorize_terrain(terrain_map.height_data)
+        frame.set_preview(Image.fromarray(image_data, "RGBA"))
+
     def _update_loading_state(self):
-        """Shows or hides the loading container based on the loading state."""
-        is_loading = len(self.loading_frames) > 0
+        """
+        Shows or hides the loading container and the canvas based on the
+        loading state.
+        """
+        is_blocked = any(key in self.BLOCKING_LOADERS for key in self.loading_frames)
 
-        if is_loading:
+        if is_blocked:
             self.loading_container.place(relx=0.5, rely=0.5, anchor="center")
             self.loading_container.lift()
             if self.canvas_to_manage:
                 self.canvas_to_manage.grid_forget()
+            return
+
+        # Nothing hides the canvas anymore.
+        self.on_canvas_ready_callback()
+
+        if self.loading_frames:
+            self.loading_container.place(
+                relx=0.5, rely=0.0, y=self.BACKGROUND_INDICATOR_MARGIN, anchor="n"
+            )
+            self.loading_container.lift()
         else:
             self.loading_container.place_forget()
-            self.on_load_finish_callback()
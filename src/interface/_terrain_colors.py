@@ -0,0 +1,17 @@
+import numpy as np
+from matplotlib import cm
+
+# The terrain colormap sampled once into 256 RGBA entries, one per height
+# level, so colorizing any part of a map is a single table lookup.
+_lut_colors = cm.terrain(np.arange(256))  # type: ignore
+TERRAIN_LUT: np.ndarray = (_lut_colors * 255).astype(np.uint8)
+
+
+def colorize_terrain(height_data: np.ndarray) -> np.ndarray:
+    """
+    Colors 0-255 heights with the terrain colormap, returning a uint8 RGBA
+    array. Gives exactly the colors of `cm.terrain(height_data / 255)`.
+    """
+    # The same binning the colormap applies to its 0-1 input.
+    indices = np.clip(height_data / 255.0 * 256, 0, 255).astype(np.uint8)
+    return TERRAIN_LUT[indices]
@@ -45,7 +45,7 @@ class App(ctk.CTk):
         self.canvas: MapCanvas | None = None
 
         self.loading_manager = LoadingManager(
-            self.left_frame, on_load_finish_callback=self._on_all_loading_finished
+            self.left_frame, on_canvas_ready_callback=self._on_canvas_ready
         )
 
         from state_managers import canvas_state_manager
@@ -62,16 +62,25 @@ class App(ctk.CTk):
                 "path", "Calculating Path...", loading
             ),
         )
+        map_manager.add_map_preview_callback(self.loading_manager.show_map_preview)
 
-    def _on_all_loading_finished(self):
-        """Callback for when the LoadingManager reports no more active loaders."""
+    def _on_canvas_ready(self):
+        """
+        Callback for when the LoadingManager reports that no loader hides the
+        canvas anymore. Paths may still be calculating in the background.
+        """
         self._on_game_start()
 
     def _on_game_start(self):
-        """Initializes and displays the main map canvas."""
-        self.canvas = MapCanvas(self.left_frame)
+        """
+        Displays the main map canvas. It is created on the first load only;
+        after that the same canvas is shown again, and it keeps itself up to
+        date with the map and the path while hidden.
+        """
+        if self.canvas is None:
+            self.canvas = MapCanvas(self.left_frame)
+            self.loading_manager.set_canvas(self.canvas)
         self.canvas.grid(row=1, column=0, sticky="nsew")
-        self.loading_manager.set_canvas(self.canvas)
-        # Ensure loading container is on top if a new loading task started
-        # while the canvas was being created.
+        # Ensure the loading container is on top of the canvas, whether it
+        # covers a new loading task or shows a path calculating behind it.
         self.loading_manager.loading_container.lift()
@@ -1,7 +1,10 @@
 import customtkinter as ctk
+from PIL import Image
 
 
 class LoadingFrame(ctk.CTkFrame):
+    PREVIEW_SIZE = 256
+
     def __init__(self, parent, text: str):
         super().__init__(parent, fg_color="transparent")
 
@@ -15,3 +18,18 @@ class LoadingFrame(ctk.CTkFrame):
         self.loading_progress.pack(pady=10, padx=20, fill="x")
 
         self.loading_progress.start()
+
+        self.preview_label: ctk.CTkLabel | None = None
+
+    def set_preview(self, image: Image.Image):
+        """Shows (or replaces) a preview image above the progress bar."""
+        scale = self.PREVIEW_SIZE / max(image.width, image.height)
+        size = (round(image.width * scale), round(image.height * scale))
+        # Pixelated upscaling keeps coarse previews honest about their detail.
+        preview = ctk.CTkImage(image.resize(size, Image.NEAREST), size=size)  # type: ignore
+
+        if self.preview_label is None:
+            self.preview_label = ctk.CTkLabel(self, text="", image=preview)
+            self.preview_label.pack(pady=10, before=self.loading_progress)
+        else:
+            self.preview_label.configure(image=preview)
@@ -13,14 +13,17 @@ class CanvasCamera:
         self._grid_draw_offset: tuple[int, int] = (0, 0)
 
     @property
-    def zoom_level(self) -> int:
+    def zoom_level(self) -> float:
         """The current magnification level of the canvas."""
         return self._zoom_level
 
-    def set_zoom_level(self, value: int, origin_x: int, origin_y: int):
-        """Sets the zoom level, clamping it to a minimum of 1."""
-        if value < 1:
-            value = 1
+    def set_zoom_level(self, value: float, origin_x: int, origin_y: int):
+        """
+        Sets the zoom level. Levels below 1 show the map zoomed out, and
+        non-positive levels are ignored.
+        """
+        if value <= 0:
+            return
         if abs(value - self._zoom_level) < 1e-9:
             return
 
@@ -1,94 +1,326 @@
+import math
 from typing import TYPE_CHECKING
 import numpy as np
 from PIL import Image, ImageTk
-from matplotlib import cm
+from config import config
 from core import map_manager
+from interface._terrain_colors import colorize_terrain
+from ._mipmap_pyramid import MipmapPyramid
+from ._path_cost_layer import PathCostLayer
+from ._raster_layer import LayerStack
+from ._steepness_layer import SteepnessLayer
+from ._tile_cache import TileCache
 
 if TYPE_CHECKING:
     from .map_canvas import MapCanvas
+    from terrain_map import TerrainMap
 
 
 class CanvasMapRenderer:
-    """Handles drawing objects onto the MapCanvas."""
+    """
+    Handles drawing the terrain onto the MapCanvas.
+
+    Only the part of the map inside the viewport is drawn, as square tiles of
+    `tile_size` canvas pixels on a fixed grid. Tiles are rendered lazily as
+    the view is panned or zoomed and kept in a least recently used cache
+    keyed by (zoom, column, row) with a memory budget, so the cost of a frame
+    depends on the size of the canvas rather than on the size of the map or
+    the zoom level.
+
+    Zoom levels of 1 and above are whole numbers of canvas pixels per cell.
+    Below 1 they are powers of two (1/2, 1/4, ...), drawn from a mipmap
+    pyramid of the colored terrain, so zoomed-out views are properly
+    downsampled and every tile still covers the same number of pixels.
+
+    Raster overlays, like the steepness heatmap and the path colored by move
+    cost, are kept in a stack of layers that are blended into the terrain as
+    tiles are rendered. Each layer tracks the regions it changed, and only
+    the tiles over those are composited and uploaded again.
+    """
+
+    TAG = "terrain_map"
 
     def __init__(self, canvas: "MapCanvas"):
         from core import map_manager
 
         self.canvas = canvas
+        self.tile_size: int = config.canvas.TILE_SIZE
+        self.max_mipmap_levels: int = config.canvas.MAX_MIPMAP_LEVELS
+        self.tile_cache: TileCache[ImageTk.PhotoImage] = TileCache(
+            int(config.canvas.TILE_CACHE_MB * 1024 * 1024)
+        )
+        # Kept across maps, so the layers shown stay shown.
+        self.layers = LayerStack()
+        self.steepness = self.layers.add(SteepnessLayer())
+        self.path_costs = self.layers.add(PathCostLayer())
         self._reset_cache()
 
         map_manager.add_map_change_callback(self.change_map)
 
     def _reset_cache(self):
-        self.image_cache = {}
-        self.original_pil_images = {}
-        self.current_photo_images = {}
+        self.tile_cache.clear()
+        # The canvas item and image of every tile on screen, by (column, row).
+        # The images are referenced here so eviction never blanks a tile.
+        self.visible_tiles: dict[tuple[int, int], tuple[int, ImageTk.PhotoImage]] = {}
+        # The colored map, from one pixel per cell down to the smallest zoom.
+        self.pyramid: MipmapPyramid | None = None
+        # The map the tiles show, and how many of its edits they include.
+        self._rendered_map: "TerrainMap | None" = None
+        self._applied_edits = 0
 
-    def _create_terrain_image(self):
+    def render_map(self):
+        """Renders the current map on the canvas from scratch."""
+        print("rendering map")
         terrain_map = map_manager.map
 
-        height_data = terrain_map.height_data
-        colored_data = cm.terrain(height_data / 255.0)  # type: ignore
+        self.canvas.delete(self.TAG)
+        self._reset_cache()
+        self.pyramid = MipmapPyramid(
+            colorize_terrain(terrain_map.height_data), self.max_mipmap_levels
+        )
+        self.layers.reset(terrain_map.height_data.shape, self.max_mipmap_levels)
+        self.steepness.set_map(terrain_map)
+        # Every tile is rendered from scratch below.
+        self.layers.take_dirty()
+        self._rendered_map = terrain_map
+        self._applied_edits = len(terrain_map.edits)
 
-        image_data = (colored_data * 255).astype(np.uint8)
-        pil_image = Image.fromarray(image_data, "RGBA")
+        self.rescale()
+
+    def change_map(self):
+        """
+        Updates the terrain after the map was edited. Only the regions of the
+        new edits are recolored, at every mipmap level, and only the tiles
+        they overlap are touched, so an edit costs the same on any map size.
+        """
+        terrain_map = map_manager.map
+        if terrain_map is not self._rendered_map or self.pyramid is None:
+            self.render_map()
+            return
 
-        self.original_pil_images["terrain_map"] = pil_image
+        new_edits = terrain_map.edits[self._applied_edits :]
+        for rows, cols in new_edits:
+            self.pyramid.update(
+                rows, cols, colorize_terrain(terrain_map.height_data[rows, cols])
+            )
+            self.steepness.paint(*terrain_map.gradient_region(rows, cols))
+        self._applied_edits = len(terrain_map.edits)
+        self._update_tiles(new_edits + self.layers.take_dirty())
 
-        photo_image = ImageTk.PhotoImage(pil_image)
-        self.image_cache[("terrain_map", 1)] = photo_image
-        self.current_photo_images["terrain_map"] = photo_image
+    def set_path_costs(self, nodes: list[tuple[int, int]]):
+        """Paints a path on the path cost layer, colored by move cost."""
+        from game._pathfinder import Pathfinder
 
-        return photo_image
+        if self.pyramid is None:
+            return
 
-    def render_map(self):
-        """Generates a new map and renders it on the canvas."""
-        print("rendering map")
-        tag = "terrain_map"
-        self._reset_cache()
-        new_photo_image = self._create_terrain_image()
+        move_costs = (
+            Pathfinder(map_manager.map).get_move_costs(nodes)
+            if len(nodes) > 1
+            else np.empty(0)
+        )
+        self.path_costs.set_path(nodes, move_costs)
+        self.refresh_layers()
 
-        # Check if the image item already exists
-        if self.canvas.find_withtag(tag):
-            self.canvas.itemconfig(tag, image=new_photo_image)
-        else:
-            self.canvas.create_image(0, 0, image=new_photo_image, anchor="nw", tags=tag)
+    def set_layer_visible(self, name: str, visible: bool):
+        """Shows or hides a raster layer."""
+        self.layers.get(name).set_visible(visible)
+        self.refresh_layers()
 
-        self.rescale()
+    def refresh_layers(self):
+        """Redraws the tiles over the regions the layers changed."""
+        if self.pyramid is None:
+            return
+        self._update_tiles(self.layers.take_dirty())
 
-    def change_map(self):
-        tag = "terrain_map"
+    def _update_tiles(self, regions: list[tuple[slice, slice]]):
+        """
+        Redraws the parts of (rows, cols) map regions in the tiles on screen,
+        with a single upload per tile, and invalidates the other cached tiles
+        they overlap. Those are only rendered again if they are ever shown.
+        """
+        if not regions:
+            return
 
-        self._reset_cache()
-        new_photo_image = self._create_terrain_image()
-        self.canvas.itemconfig(tag, image=new_photo_image)
+        current_zoom = self.canvas.zoom_level
+        for (column, row), (_, photo_image) in self.visible_tiles.items():
+            overlap = self._regions_overlap(current_zoom, column, row, regions)
+            if overlap is None:
+                continue
 
-        self.rescale()
+            x0, y0, x1, y1 = overlap
+            pixels = self._scaled_pixels(current_zoom, x0, y0, x1, y1)
+            tile_x, tile_y = column * self.tile_size, row * self.tile_size
+            self._put_pixels(photo_image, pixels, x0 - tile_x, y0 - tile_y)
+
+        self.tile_cache.invalidate(
+            (zoom, column, row)
+            for zoom, column, row in self.tile_cache.keys()
+            if (zoom != current_zoom or (column, row) not in self.visible_tiles)
+            and self._regions_overlap(zoom, column, row, regions) is not None
+        )
+
+    def _regions_overlap(
+        self,
+        zoom: float,
+        column: int,
+        row: int,
+        regions: list[tuple[slice, slice]],
+    ) -> tuple[int, int, int, int] | None:
+        """
+        Returns the (x0, y0, x1, y1) canvas pixels of a tile bounding all of
+        its overlaps with some map regions, or None if it overlaps none.
+        """
+        overlaps = [
+            overlap
+            for rows, cols in regions
+            if (overlap := self._tile_overlap(zoom, column, row, rows, cols))
+            is not None
+        ]
+        if not overlaps:
+            return None
+        x0s, y0s, x1s, y1s = zip(*overlaps)
+        return min(x0s), min(y0s), max(x1s), max(y1s)
+
+    def _tile_overlap(
+        self, zoom: float, column: int, row: int, rows: slice, cols: slice
+    ) -> tuple[int, int, int, int] | None:
+        """
+        Returns the (x0, y0, x1, y1) canvas pixels of a tile covering a
+        (rows, cols) map region, or None if the tile doesn't overlap it.
+        """
+        level, scale = self._mipmap_level(zoom)
+        level_rows, level_cols = MipmapPyramid.region_at(level, rows, cols)
+
+        tile_x, tile_y = column * self.tile_size, row * self.tile_size
+        x0 = max(level_cols.start * scale, tile_x)
+        y0 = max(level_rows.start * scale, tile_y)
+        x1 = min(level_cols.stop * scale, tile_x + self.tile_size)
+        y1 = min(level_rows.stop * scale, tile_y + self.tile_size)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def _mipmap_level(self, zoom: float) -> tuple[int, int]:
+        """
+        Returns the mipmap level a zoom is drawn from, and how many canvas
+        pixels each of its pixels covers.
+        """
+        if zoom >= 1:
+            return 0, int(zoom)
+        return round(-math.log2(zoom)), 1
+
+    def _pixels_size(self, zoom: float) -> tuple[int, int]:
+        """The (width, height) of the whole map in canvas pixels at a zoom."""
+        assert self.pyramid is not None
+        level, scale = self._mipmap_level(zoom)
+        height, width = self.pyramid.levels[level].shape[:2]
+        return width * scale, height * scale
+
+    def _scaled_pixels(self, zoom: float, x0: int, y0: int, x1: int, y1: int):
+        """
+        Returns the [x0, x1) x [y0, y1) rectangle of canvas pixels of the map
+        at a zoom level.
+        """
+        assert self.pyramid is not None
+        level, scale = self._mipmap_level(zoom)
+        rows = slice(y0 // scale, (y1 - 1) // scale + 1)
+        cols = slice(x0 // scale, (x1 - 1) // scale + 1)
+        cells = self.layers.composite(
+            self.pyramid.levels[level][rows, cols], level, rows, cols
+        )
+        if scale == 1:
+            return cells
+        pixels = cells.repeat(scale, axis=0).repeat(scale, axis=1)
+
+        top, left = y0 - rows.start * scale, x0 - cols.start * scale
+        return pixels[top : top + y1 - y0, left : left + x1 - x0]
+
+    def _put_pixels(
+        self, photo_image: ImageTk.PhotoImage, rgba: np.ndarray, x: int, y: int
+    ):
+        """
+        Writes a block of opaque pixels into a PhotoImage at (x, y), leaving
+        the rest of it untouched. The block is handed to Tk as binary PPM
+        data, which it copies straight into the image.
+        """
+        height, width = rgba.shape[:2]
+        rgb = np.ascontiguousarray(rgba[..., :3])
+        ppm_data = b"P6 %d %d 255\n" % (width, height) + rgb.tobytes()
+        self.canvas.tk.call(
+            str(photo_image), "put", ppm_data, "-format", "ppm", "-to", x, y
+        )
+
+    def _get_tile(self, zoom: float, column: int, row: int) -> ImageTk.PhotoImage:
+        """Returns a tile from the cache, rendering it if it isn't there."""
+        key = (zoom, column, row)
+        cached = self.tile_cache.get(key)
+        if cached is not None:
+            return cached
+
+        pixels_width, pixels_height = self._pixels_size(zoom)
+        x0, y0 = column * self.tile_size, row * self.tile_size
+        x1 = min(x0 + self.tile_size, pixels_width)
+        y1 = min(y0 + self.tile_size, pixels_height)
+
+        pixels = self._scaled_pixels(zoom, x0, y0, x1, y1)
+        photo_image = ImageTk.PhotoImage(Image.fromarray(pixels, "RGBA"))
+
+        self.tile_cache.put(key, photo_image, x1 - x0, y1 - y0)
+        return photo_image
+
+    def _visible_tile_range(self, zoom: float) -> tuple[range, range]:
+        """The columns and rows of the tiles overlapping the viewport."""
+        pixels_width, pixels_height = self._pixels_size(zoom)
+
+        view_x, view_y = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        view_width, view_height = self.canvas.winfo_width(), self.canvas.winfo_height()
+
+        first_column = max(0, math.floor(view_x / self.tile_size))
+        first_row = max(0, math.floor(view_y / self.tile_size))
+        last_column = min(
+            math.ceil((view_x + view_width) / self.tile_size),
+            math.ceil(pixels_width / self.tile_size),
+        )
+        last_row = min(
+            math.ceil((view_y + view_height) / self.tile_size),
+            math.ceil(pixels_height / self.tile_size),
+        )
+        return range(first_column, last_column), range(first_row, last_row)
 
     def rescale(self):
-        """Rescales the 'terrain_map' image based on the current canvas zoom level."""
-        tag = "terrain_map"
+        """
+        Shows the tiles covering the viewport at the current zoom level,
+        rendering any that aren't cached. Called after every pan and zoom.
+        """
+        if self.pyramid is None:
+            return
+
         zoom = self.canvas.zoom_level
-        cache_key = (tag, zoom)
+        columns, rows = self._visible_tile_range(zoom)
+        visible = {(column, row) for column in columns for row in rows}
 
-        if cache_key in self.image_cache:
-            new_photo_image = self.image_cache[cache_key]
-        else:
-            original_pil_image = self.original_pil_images.get(tag)
-            if not original_pil_image:
-                return
+        for position in list(self.visible_tiles):
+            if position not in visible:
+                item, _ = self.visible_tiles.pop(position)
+                self.canvas.delete(item)
 
-            new_width = int(original_pil_image.width * zoom)
-            new_height = int(original_pil_image.height * zoom)
+        for column, row in visible:
+            photo_image = self._get_tile(zoom, column, row)
+            shown = self.visible_tiles.get((column, row))
+            if shown is None:
+                item = self.canvas.create_image(
+                    column * self.tile_size,
+                    row * self.tile_size,
+                    image=photo_image,
+                    anchor="nw",
+                    tags=self.TAG,
+                )
+            else:
+                item = shown[0]
+                if shown[1] is not photo_image:
+                    self.canvas.itemconfig(item, image=photo_image)
+            self.visible_tiles[(column, row)] = (item, photo_image)
 
-            scaled_pil_image = original_pil_image.resize(
-                (new_width, new_height), Image.NEAREST  # type: ignore
-            )
-            new_photo_image = ImageTk.PhotoImage(scaled_pil_image)
-            self.image_cache[cache_key] = new_photo_image
-
-        old_coords = self.canvas.coords(tag)
-        old_x, old_y = old_coords if old_coords else (0, 0)
-        self.canvas.coords(tag, old_x, old_y)
-        self.canvas.itemconfig(tag, image=new_photo_image)
-        self.current_photo_images[tag] = new_photo_image
+        # Keep the terrain below the path and the pins.
+        self.canvas.tag_lower(self.TAG)
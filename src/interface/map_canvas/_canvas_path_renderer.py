@@ -1,53 +1,137 @@
 from typing import TYPE_CHECKING
+import numpy as np
+from ._polyline import simplify_polyline
 
 if TYPE_CHECKING:
     from .map_canvas import MapCanvas
 
 
 class CanvasPathRenderer:
-    """Handles drawing the path on the canvas."""
+    """
+    Handles drawing the path on the canvas.
+
+    The path is a single line item, kept for as long as a path is shown.
+    Zooming transforms its coordinates in place instead of recreating it,
+    and the line is simplified to what can be told apart at the current
+    zoom, so Tk doesn't redraw thousands of vertices that land on the same
+    few pixels.
+    """
 
     PATH_TAG = "path"
     PATH_COLOR = "red"
     PATH_WIDTH = 2
+    # A stale path, shown while its replacement is being calculated.
+    DIMMED_PATH_COLOR = "#8c4a4a"
+    DIMMED_PATH_DASH = (6, 4)
+    # How far, in canvas pixels, the drawn line may stray from the path.
+    SIMPLIFY_TOLERANCE = 0.5
 
     def __init__(self, canvas: "MapCanvas"):
         self.canvas = canvas
-        self.map_path_coords: list[tuple[float, float]] = []
+        self.map_path_coords: np.ndarray = np.empty((0, 2))
+        self.dimmed = False
+        # Hidden while the path is shown colored by cost on the terrain.
+        self.hidden = False
+
+        # The indices of the path nodes the line keeps, by zoom level.
+        self._simplified: dict[float, np.ndarray] = {}
+        self._line: int | None = None
+        # The zoom level the coordinates of the line are for, and its nodes.
+        self._line_zoom = 1.0
+        self._line_nodes: np.ndarray = np.empty(0, dtype=np.intp)
 
     def render_path(self, path_points: list[tuple[float, float]]):
         """
-        Renders the path on the canvas.
+        Renders the path on the canvas, reusing the line of the previous one.
 
         Args:
             path_points (list[tuple[float, float]]): A list of (x, y) map coordinates.
         """
-        self.map_path_coords = path_points
-        self.canvas.delete(self.PATH_TAG)
+        self.map_path_coords = np.asarray(path_points, dtype=np.float64).reshape(-1, 2)
+        self._simplified = {}
 
-        if len(path_points) < 2:
+        if len(self.map_path_coords) < 2:
+            self._delete_line()
             return
 
-        zoom = self.canvas.zoom_level
-        # Convert map coordinates to canvas coordinates
-        canvas_coords = [
-            coord
-            for point in path_points
-            for coord in ((point[0] + 0.5) * zoom, (point[1] + 0.5) * zoom)
-        ]
-
-        self.canvas.create_line(
-            *canvas_coords,
-            fill=self.PATH_COLOR,
-            width=self.PATH_WIDTH,
-            tags=(self.PATH_TAG,)
-        )
+        self._draw_line(self.canvas.zoom_level)
+
+    def _simplified_nodes(self, zoom: float) -> np.ndarray:
+        """Returns the indices of the path nodes drawn at a zoom level."""
+        nodes = self._simplified.get(zoom)
+        if nodes is None:
+            nodes = simplify_polyline(
+                self.map_path_coords, self.SIMPLIFY_TOLERANCE / zoom
+            )
+            self._simplified[zoom] = nodes
+        return nodes
+
+    def _draw_line(self, zoom: float):
+        """Sets the line to the simplified path at a zoom, creating it if needed."""
+        nodes = self._simplified_nodes(zoom)
+        # Convert map coordinates to the centers of the cells on the canvas
+        canvas_coords = ((self.map_path_coords[nodes] + 0.5) * zoom).ravel().tolist()
+
+        if self._line is None:
+            self._line = self.canvas.create_line(
+                *canvas_coords,
+                width=self.PATH_WIDTH,
+                tags=(self.PATH_TAG,),
+                **self._line_style()
+            )
+        else:
+            self.canvas.coords(self._line, canvas_coords)
+
+        self._line_zoom = zoom
+        self._line_nodes = nodes
+
+    def _delete_line(self):
+        self.canvas.delete(self.PATH_TAG)
+        self._line = None
+
+    def _line_style(self) -> dict:
+        state = "hidden" if self.hidden else "normal"
+        if self.dimmed:
+            return {
+                "fill": self.DIMMED_PATH_COLOR,
+                "dash": self.DIMMED_PATH_DASH,
+                "state": state,
+            }
+        return {"fill": self.PATH_COLOR, "dash": (), "state": state}
+
+    def set_dimmed(self, dimmed: bool):
+        """
+        Dims the path while a new one is being calculated, or restores it.
+        The new path replaces the dimmed one in a single step once it arrives.
+        """
+        self.dimmed = dimmed
+        self.canvas.itemconfig(self.PATH_TAG, **self._line_style())
+
+    def set_hidden(self, hidden: bool):
+        """Hides the line, or shows it again."""
+        self.hidden = hidden
+        self.canvas.itemconfig(self.PATH_TAG, **self._line_style())
 
     def rescale(self):
-        """Rescales the path based on the current canvas zoom level."""
-        self.render_path(self.map_path_coords)
+        """
+        Rescales the path to the current canvas zoom level. When the same
+        nodes are drawn at both zoom levels, Tk scales the line itself;
+        otherwise only its coordinates are replaced.
+        """
+        if self._line is None:
+            return
+
+        zoom = self.canvas.zoom_level
+        if np.array_equal(self._simplified_nodes(zoom), self._line_nodes):
+            # Canvas coordinates are proportional to the zoom, about (0, 0).
+            factor = zoom / self._line_zoom
+            self.canvas.scale(self._line, 0, 0, factor, factor)
+            self._line_zoom = zoom
+        else:
+            self._draw_line(zoom)
 
     def clear_path(self):
         """Removes the path from the canvas and clears the stored coordinates."""
-        self.map_path_coords = []
-        self.canvas.delete(self.PATH_TAG)
+        self.map_path_coords = np.empty((0, 2))
+        self._simplified = {}
+        self._delete_line()
@@ -1,3 +1,4 @@
+import math
 import customtkinter as ctk
 from config import config
 from typing import TYPE_CHECKING, cast
@@ -15,6 +16,7 @@ class CanvasScroller:
         self.last_y: int = 0
 
         self.scrolling = False
+        self._scroll_events_bound = False
 
         self.canvas.after(250, self.configure_zoom)
 
@@ -23,18 +25,28 @@ class CanvasScroller:
     def configure_zoom(self):
         from state_managers import canvas_state_manager
 
-        initial_zoom: int = min(
-            self.canvas_size[0] // config.MAP_WIDTH,
-            self.canvas_size[1] // config.MAP_HEIGHT,
+        # The largest zoom that fits the whole map on the canvas. Maps bigger
+        # than the canvas start zoomed out, at a power of two below 1.
+        fitting_zoom = min(
+            self.canvas_size[0] / config.MAP_WIDTH,
+            self.canvas_size[1] / config.MAP_HEIGHT,
         )
+        if fitting_zoom >= 1:
+            initial_zoom: float = int(fitting_zoom)
+        else:
+            initial_zoom = self._zoomed_out_level(math.floor(math.log2(fitting_zoom)))
 
         initial_zoom_var = cast(
             ctk.DoubleVar, canvas_state_manager.vars["initial_zoom"]
         )
         initial_zoom_var.set(initial_zoom)
 
-        self.min_zoom = initial_zoom - config.canvas.ZOOM_LEFT_OFFSET
-        self.max_zoom = initial_zoom + config.canvas.ZOOM_RIGHT_OFFSET
+        self.min_zoom = min(
+            max(1, initial_zoom - config.canvas.ZOOM_LEFT_OFFSET), initial_zoom
+        )
+        self.max_zoom = max(1, initial_zoom + config.canvas.ZOOM_RIGHT_OFFSET)
+        canvas_state_manager.vars["min_zoom"].set(self.min_zoom)
+        canvas_state_manager.vars["max_zoom"].set(self.max_zoom)
 
         self._bind_scroll_events()
 
@@ -44,6 +56,12 @@ class CanvasScroller:
     def _bind_scroll_events(self):
         from state_managers import canvas_state_manager
 
+        # configure_zoom runs on every resize and new map, but the bindings
+        # and the zoom callback must only be added once.
+        if self._scroll_events_bound:
+            return
+        self._scroll_events_bound = True
+
         canvas_state_manager.add_callback("zoom", self._on_zoom_change)
 
         self.canvas.bind("<ButtonPress-3>", self._start_scroll)
@@ -55,6 +73,25 @@ class CanvasScroller:
         self.canvas.bind("<Button-4>", self._on_mouse_wheel)
         self.canvas.bind("<Button-5>", self._on_mouse_wheel)
 
+    @staticmethod
+    def _zoomed_out_level(exponent: int) -> float:
+        """
+        Returns the zoom 2**exponent for a negative exponent, limited to the
+        smallest zoom the renderer has a mipmap level for.
+        """
+        return 2.0 ** max(exponent, -config.canvas.MAX_MIPMAP_LEVELS)
+
+    def _snap_zoom(self, zoom: float) -> float:
+        """
+        Rounds a zoom to the closest level the canvas can show: whole numbers
+        from 1 up, and powers of two below 1.
+        """
+        if zoom >= 1:
+            return int(zoom)
+        if zoom <= 0:
+            return self.min_zoom
+        return self._zoomed_out_level(round(math.log2(zoom)))
+
     def _on_resize(self, event):
         """Handle window resizing."""
         self.configure_zoom()
@@ -75,6 +112,7 @@ class CanvasScroller:
             self.canvas.scan_dragto(scroll_x, scroll_y, gain=1)
             self.last_x = scroll_x
             self.last_y = scroll_y
+            self.canvas.map_renderer.rescale()
 
     def _clamped_scroll_position(self, x: int, y: int) -> tuple[int, int]:
         """Clamp the scroll position to the canvas boundaries."""
@@ -107,36 +145,48 @@ class CanvasScroller:
 
         canvas_width, canvas_height = self.canvas_size
         zoom = self.canvas.zoom_level
-        canvas_center_x = canvas_width // 2 - (map_manager.map.width * zoom) // 2
-        canvas_center_y = canvas_height // 2 - (map_manager.map.height * zoom) // 2
+        canvas_center_x = canvas_width // 2 - int(map_manager.map.width * zoom) // 2
+        canvas_center_y = canvas_height // 2 - int(map_manager.map.height * zoom) // 2
 
         self.canvas.scan_dragto(canvas_center_x, canvas_center_y, gain=1)
         self.last_x = canvas_center_x
         self.last_y = canvas_center_y
+        self.canvas.map_renderer.rescale()
 
     def _on_mouse_wheel(self, event):
-        """Handle mouse wheel scrolling for zooming."""
+        """
+        Handle mouse wheel scrolling for zooming. Below a zoom of 1 every
+        step halves or doubles the zoom instead.
+        """
         zoom = -1
+        current_zoom = self.canvas.zoom_level
         if event.num == 5 or event.delta < 0:
             # Scroll down, zoom out
-            zoom = self.canvas.zoom_level - config.canvas.STEPS_PER_SCROLL
+            if current_zoom > 1:
+                zoom = max(1, current_zoom - config.canvas.STEPS_PER_SCROLL)
+            else:
+                zoom = current_zoom / 2
         elif event.num == 4 or event.delta > 0:
             # Scroll up, zoom in
-            zoom = self.canvas.zoom_level + config.canvas.STEPS_PER_SCROLL
+            if current_zoom >= 1:
+                zoom = current_zoom + config.canvas.STEPS_PER_SCROLL
+            else:
+                zoom = current_zoom * 2
 
         if zoom != -1:
+            zoom = max(self.min_zoom, min(self.max_zoom, zoom))
             self._set_zoom(zoom, event.x, event.y)
 
     def _set_zoom(self, new_zoom, origin_x: int = 0, origin_y: int = 0):
         from state_managers import canvas_state_manager
 
         self._on_zoom_change(new_zoom, origin_x, origin_y)
-        zoom_var = cast(ctk.IntVar, canvas_state_manager.vars["zoom"])
+        zoom_var = cast(ctk.DoubleVar, canvas_state_manager.vars["zoom"])
         zoom_var.set(new_zoom)
 
     def _on_zoom_change(self, new_zoom, origin_x: int = 0, origin_y: int = 0):
         """Clamp new_zoom and execute the zoom at each frame."""
-        new_zoom = int(new_zoom)
+        new_zoom = self._snap_zoom(new_zoom)
         new_zoom = max(self.min_zoom, min(self.max_zoom, new_zoom))
         if new_zoom != self.canvas.zoom_level:
             self.canvas.set_zoom_level(new_zoom, origin_x, origin_y)
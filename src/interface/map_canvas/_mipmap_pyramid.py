@@ -0,0 +1,60 @@
+import numpy as np
+
+
+class MipmapPyramid:
+    """
+    The colored terrain at successively halved resolutions, for drawing the
+    map zoomed out. Level 0 holds one pixel per map cell, and every pixel of
+    level k is the average of the 2x2 pixels of level k - 1 it covers, so a
+    zoom of 1 / 2**k is drawn from level k without any aliasing.
+
+    Edits are applied incrementally: only the pixels over the edited region
+    are recomputed at every level.
+    """
+
+    def __init__(self, base: np.ndarray, max_levels: int):
+        self.levels: list[np.ndarray] = [base]
+        for _ in range(max_levels):
+            self.levels.append(self._downsample(self.levels[-1]))
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    @staticmethod
+    def region_at(level: int, rows: slice, cols: slice) -> tuple[slice, slice]:
+        """Returns the pixels of a level covering a (rows, cols) map region."""
+        return (
+            slice(rows.start >> level, ((rows.stop - 1) >> level) + 1),
+            slice(cols.start >> level, ((cols.stop - 1) >> level) + 1),
+        )
+
+    @staticmethod
+    def _downsample(pixels: np.ndarray) -> np.ndarray:
+        """
+        Averages every 2x2 block of RGBA pixels. An odd last row or column
+        is averaged with itself.
+        """
+        height, width = pixels.shape[:2]
+        padded = np.pad(pixels, ((0, height % 2), (0, width % 2), (0, 0)), "edge")
+        padded = padded.astype(np.uint16)
+        summed = (
+            padded[0::2, 0::2]
+            + padded[1::2, 0::2]
+            + padded[0::2, 1::2]
+            + padded[1::2, 1::2]
+        )
+        return ((summed + 2) // 4).astype(np.uint8)
+
+    def update(self, rows: slice, cols: slice, pixels: np.ndarray):
+        """
+        Replaces the (rows, cols) region of the base level with new pixels
+        and recomputes the region above it at every other level.
+        """
+        self.levels[0][rows, cols] = pixels
+        for level in range(1, len(self.levels)):
+            level_rows, level_cols = self.region_at(level, rows, cols)
+            source = self.levels[level - 1][
+                level_rows.start * 2 : level_rows.stop * 2,
+                level_cols.start * 2 : level_cols.stop * 2,
+            ]
+            self.levels[level][level_rows, level_cols] = self._downsample(source)
@@ -0,0 +1,62 @@
+import numpy as np
+from matplotlib import cm
+from config import config
+from ._raster_layer import RasterLayer
+
+# The colors of move costs, from cheap (green) to expensive (red), sampled
+# once like the terrain colormap.
+_lut_colors = cm.RdYlGn_r(np.linspace(0, 1, 256))  # type: ignore
+COST_LUT: np.ndarray = (_lut_colors * 255).astype(np.uint8)
+
+
+class PathCostLayer(RasterLayer):
+    """
+    The path drawn over the terrain with every cell colored by the cost of
+    the move into it, which makes visible where along the route the cost
+    accumulates. When the path changes, only the cells whose color changed
+    are repainted.
+    """
+
+    NAME = "path_costs"
+    # Move costs per cell travelled span the colors from the flat move cost
+    # up to this many times it.
+    COST_RANGE = 16.0
+
+    def __init__(self):
+        super().__init__(self.NAME)
+        # The (x, y) cells currently painted.
+        self.cells: np.ndarray = np.empty((0, 2), dtype=np.intp)
+
+    def reset(self, shape: tuple[int, int], max_levels: int):
+        super().reset(shape, max_levels)
+        self.cells = np.empty((0, 2), dtype=np.intp)
+
+    def _colors(self, cells: np.ndarray, move_costs: np.ndarray) -> np.ndarray:
+        """The color of every cell of a path, the start taking its first move's."""
+        distances = np.hypot(*np.diff(cells, axis=0).T)
+        relative_costs = move_costs / (distances * config.pathfinding.FLAT_MOVE_COST)
+        levels = np.log(np.maximum(relative_costs, 1.0)) / np.log(self.COST_RANGE)
+        indices = (np.clip(levels, 0, 1) * 255).astype(np.uint8)
+        return COST_LUT[np.concatenate((indices[:1], indices))]
+
+    def set_path(self, nodes: list[tuple[int, int]], move_costs: np.ndarray):
+        """
+        Replaces the painted path with a new one, given its (x, y) nodes and
+        the cost of each of its moves.
+        """
+        pixels = self.pixels
+        cells = np.asarray(nodes, dtype=np.intp).reshape(-1, 2)
+        if len(cells) < 2:
+            cells = cells[:0]
+
+        touched = np.unique(np.concatenate((self.cells, cells)), axis=0)
+        xs, ys = touched[:, 0], touched[:, 1]
+        before = pixels[ys, xs]
+
+        pixels[self.cells[:, 1], self.cells[:, 0]] = 0
+        if len(cells):
+            pixels[cells[:, 1], cells[:, 0]] = self._colors(cells, move_costs)
+        self.cells = cells
+
+        changed = np.any(pixels[ys, xs] != before, axis=1)
+        self.update_cells(xs[changed], ys[changed])
@@ -0,0 +1,44 @@
+import numpy as np
+
+
+def simplify_polyline(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Simplifies a polyline with the Ramer-Douglas-Peucker algorithm.
+
+    Returns the indices of the (N, 2) `points` to keep, in order. The first
+    and last points are always kept, and no dropped point lies farther than
+    `tolerance` from the simplified line. Each step measures the distances
+    of a whole span of points at once, and spans are processed from a stack
+    rather than recursively, so long paths are cheap to simplify.
+    """
+    count = len(points)
+    if count < 3:
+        return np.arange(count)
+
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    spans = [(0, count - 1)]
+    while spans:
+        first, last = spans.pop()
+        if last - first < 2:
+            continue
+
+        start, end = points[first], points[last]
+        inner = points[first + 1 : last]
+        direction = end - start
+        length = np.hypot(*direction)
+        if length == 0:
+            distances = np.hypot(*(inner - start).T)
+        else:
+            offsets = inner - start
+            cross = offsets[:, 0] * direction[1] - offsets[:, 1] * direction[0]
+            distances = np.abs(cross) / length
+
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            spans.append((first, split))
+            spans.append((split, last))
+
+    return np.flatnonzero(keep)
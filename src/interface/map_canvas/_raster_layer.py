@@ -0,0 +1,159 @@
+import numpy as np
+from typing import TypeVar
+from ._mipmap_pyramid import MipmapPyramid
+
+
+def composite_over(base: np.ndarray, overlay: np.ndarray) -> np.ndarray:
+    """
+    Composites premultiplied RGBA pixels over opaque RGBA pixels of the same
+    shape, returning new opaque pixels.
+    """
+    alpha = overlay[..., 3:4].astype(np.uint16)
+    rgb = (base[..., :3] * (255 - alpha) + 127) // 255 + overlay[..., :3]
+    pixels = np.empty_like(base)
+    pixels[..., :3] = rgb
+    pixels[..., 3] = 255
+    return pixels
+
+
+class RasterLayer:
+    """
+    A raster overlay drawn over the terrain, with one RGBA pixel per map
+    cell and its own mipmap pyramid, so it is blended into the terrain tiles
+    at every zoom. Pixels are stored with premultiplied alpha, which keeps
+    the downsampled levels correct.
+
+    Subclasses write into `pixels` and call `update` with the regions they
+    changed. The layer keeps track of those regions while it is visible,
+    so only the tiles over them are composited and uploaded again.
+    """
+
+    # Scattered changed cells are grouped into regions of at most this many
+    # cells on a side, so two changes far apart don't redraw everything
+    # between them.
+    REGION_SIZE = 64
+
+    def __init__(self, name: str, visible: bool = False):
+        self.name = name
+        self.visible = visible
+        self.pyramid: MipmapPyramid | None = None
+        self._dirty: list[tuple[slice, slice]] = []
+
+    @property
+    def pixels(self) -> np.ndarray:
+        """The full resolution pixels of the layer."""
+        assert self.pyramid is not None
+        return self.pyramid.levels[0]
+
+    def reset(self, shape: tuple[int, int], max_levels: int):
+        """Clears the layer for a new map of the given (height, width)."""
+        self.pyramid = MipmapPyramid(np.zeros((*shape, 4), dtype=np.uint8), max_levels)
+        self._dirty = []
+
+    def update(self, rows: slice, cols: slice):
+        """
+        Recomputes the mipmaps over a (rows, cols) region of `pixels` after
+        it was written to, and marks it for redrawing if the layer is shown.
+        """
+        assert self.pyramid is not None
+        self.pyramid.update(rows, cols, self.pixels[rows, cols])
+        if self.visible:
+            self._dirty.append((rows, cols))
+
+    def update_cells(self, xs: np.ndarray, ys: np.ndarray):
+        """
+        Like `update`, for scattered (x, y) cells: they are grouped into the
+        bounding boxes of the blocks of REGION_SIZE cells they fall in.
+        """
+        blocks_per_row = self.pixels.shape[1] // self.REGION_SIZE + 1
+        blocks = (ys // self.REGION_SIZE) * blocks_per_row + xs // self.REGION_SIZE
+
+        for block in np.unique(blocks):
+            in_block = blocks == block
+            block_xs, block_ys = xs[in_block], ys[in_block]
+            self.update(
+                slice(int(block_ys.min()), int(block_ys.max()) + 1),
+                slice(int(block_xs.min()), int(block_xs.max()) + 1),
+            )
+
+    def set_visible(self, visible: bool):
+        """Shows or hides the layer, marking everything it covers for redrawing."""
+        if visible == self.visible:
+            return
+        self.visible = visible
+
+        painted = self._painted_region()
+        if painted is not None:
+            self._dirty.append(painted)
+
+    def _painted_region(self) -> tuple[slice, slice] | None:
+        """The bounding (rows, cols) of the pixels that aren't transparent."""
+        if self.pyramid is None:
+            return None
+        opaque = self.pixels[..., 3] > 0
+        rows = np.flatnonzero(opaque.any(axis=1))
+        if len(rows) == 0:
+            return None
+        cols = np.flatnonzero(opaque.any(axis=0))
+        return (
+            slice(int(rows[0]), int(rows[-1]) + 1),
+            slice(int(cols[0]), int(cols[-1]) + 1),
+        )
+
+    def take_dirty(self) -> list[tuple[slice, slice]]:
+        """Returns the regions to redraw since the last call, and forgets them."""
+        dirty, self._dirty = self._dirty, []
+        return dirty
+
+    def composite(
+        self, base: np.ndarray, level: int, rows: slice, cols: slice
+    ) -> np.ndarray:
+        """
+        Blends the (rows, cols) pixels of a mipmap level of the layer over
+        the matching base pixels. Returns `base` itself where the layer is
+        hidden or fully transparent.
+        """
+        if not self.visible or self.pyramid is None:
+            return base
+        overlay = self.pyramid.levels[level][rows, cols]
+        if not overlay[..., 3].any():
+            return base
+        return composite_over(base, overlay)
+
+
+Layer = TypeVar("Layer", bound=RasterLayer)
+
+
+class LayerStack:
+    """The raster layers drawn over the terrain, from the bottom up."""
+
+    def __init__(self):
+        self.layers: list[RasterLayer] = []
+
+    def add(self, layer: Layer) -> Layer:
+        """Adds a layer on top of the others."""
+        self.layers.append(layer)
+        return layer
+
+    def get(self, name: str) -> RasterLayer:
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        raise ValueError(f"Unknown raster layer: {name}")
+
+    def reset(self, shape: tuple[int, int], max_levels: int):
+        """Clears every layer for a new map of the given (height, width)."""
+        for layer in self.layers:
+            layer.reset(shape, max_levels)
+
+    def composite(
+        self, base: np.ndarray, level: int, rows: slice, cols: slice
+    ) -> np.ndarray:
+        """Blends every visible layer, in order, over terrain pixels."""
+        for layer in self.layers:
+            base = layer.composite(base, level, rows, cols)
+        return base
+
+    def take_dirty(self) -> list[tuple[slice, slice]]:
+        """Returns the regions to redraw of every layer, and forgets them."""
+        return [region for layer in self.layers for region in layer.take_dirty()]
@@ -0,0 +1,79 @@
+import numpy as np
+from matplotlib import cm
+from typing import TYPE_CHECKING
+from ._raster_layer import RasterLayer
+
+if TYPE_CHECKING:
+    from terrain_map import TerrainMap
+
+# How opaque the steepest cells are drawn. Flat cells are fully transparent.
+MAX_ALPHA = 176
+
+# The heatmap colors, with an opacity rising with the steepness, sampled
+# once and premultiplied so coloring a region is a single table lookup.
+_lut_colors = cm.inferno(np.linspace(0, 1, 256))  # type: ignore
+_lut_alpha = np.linspace(0, MAX_ALPHA / 255, 256)
+STEEPNESS_LUT: np.ndarray = np.round(
+    np.column_stack((_lut_colors[:, :3] * _lut_alpha[:, None], _lut_alpha)) * 255
+).astype(np.uint8)
+
+
+class SteepnessLayer(RasterLayer):
+    """
+    A heatmap of the steepness of the whole map, drawn from the gradient
+    magnitude raster of the TerrainMap. It is only colored while shown;
+    while hidden, it just remembers it has to be colored again.
+    """
+
+    NAME = "steepness"
+    # The steepness at this quantile of the map gets the hottest color. It
+    # is fixed when a map is set, so edits only recolor the cells they touch.
+    SCALE_QUANTILE = 0.99
+
+    def __init__(self):
+        super().__init__(self.NAME)
+        self.terrain_map: "TerrainMap | None" = None
+        self.scale = 1.0
+        self._stale = True
+
+    def set_map(self, terrain_map: "TerrainMap"):
+        """Colors the layer for a new map, once the layer has been reset."""
+        self.terrain_map = terrain_map
+        self.scale = max(
+            float(np.quantile(terrain_map.gradient_magnitude, self.SCALE_QUANTILE)),
+            1e-6,
+        )
+        self._stale = True
+        if self.visible:
+            self._paint_map()
+
+    def _colors(self, magnitudes: np.ndarray) -> np.ndarray:
+        indices = np.clip(magnitudes / self.scale * 255, 0, 255).astype(np.uint8)
+        return STEEPNESS_LUT[indices]
+
+    def paint(self, rows: slice, cols: slice):
+        """Recolors a (rows, cols) region after its gradients changed."""
+        if self.terrain_map is None:
+            return
+        if not self.visible:
+            self._stale = True
+            return
+
+        self.pixels[rows, cols] = self._colors(
+            self.terrain_map.gradient_magnitude[rows, cols]
+        )
+        self.update(rows, cols)
+
+    def _paint_map(self):
+        assert self.terrain_map is not None
+        self.pixels[:] = self._colors(self.terrain_map.gradient_magnitude)
+        height, width = self.pixels.shape[:2]
+        self.update(slice(0, height), slice(0, width))
+        self._stale = False
+
+    def set_visible(self, visible: bool):
+        if visible and self._stale and self.terrain_map is not None:
+            # Colored while still hidden, so the whole map isn't also marked
+            # for redrawing here; showing the layer marks what it covers.
+            self._paint_map()
+        super().set_visible(visible)
@@ -0,0 +1,102 @@
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Generic, TypeVar
+
+TileKey = tuple[float, int, int]
+T = TypeVar("T")
+
+# Tk keeps photo images as 32-bit pixels, whatever the source image was.
+BYTES_PER_PIXEL = 4
+
+
+class TileCache(Generic[T]):
+    """
+    A least recently used cache of rendered tiles, keyed by (zoom, column,
+    row) and bounded by the memory their pixels take rather than by count.
+
+    It counts hits and misses so the budget can be tuned, and tiles can be
+    invalidated one by one, so an edit only drops the tiles it touches and
+    every other zoom level survives it.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._tiles: "OrderedDict[TileKey, tuple[T, int]]" = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def __contains__(self, key: TileKey) -> bool:
+        return key in self._tiles
+
+    def keys(self) -> list[TileKey]:
+        """The keys of the cached tiles, least recently used first."""
+        return list(self._tiles)
+
+    def items(self) -> list[tuple[TileKey, T]]:
+        """The cached tiles, least recently used first."""
+        return [(key, tile) for key, (tile, _) in self._tiles.items()]
+
+    def get(self, key: TileKey) -> T | None:
+        """Returns a cached tile and marks it as recently used, or None."""
+        entry = self._tiles.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._tiles.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: TileKey, tile: T, width: int, height: int):
+        """
+        Caches a tile of `width` x `height` pixels, evicting the least
+        recently used tiles until the cache fits its budget again. The new
+        tile itself is always kept.
+        """
+        self._discard(key)
+        nbytes = width * height * BYTES_PER_PIXEL
+        self._tiles[key] = (tile, nbytes)
+        self.bytes_used += nbytes
+
+        while self.bytes_used > self.max_bytes and len(self._tiles) > 1:
+            oldest = next(iter(self._tiles))
+            self._discard(oldest)
+            self.evictions += 1
+
+    def invalidate(self, keys: Iterable[TileKey]):
+        """Drops tiles whose pixels are out of date."""
+        for key in keys:
+            if self._discard(key):
+                self.invalidations += 1
+
+    def clear(self):
+        """Drops every tile, keeping the counters."""
+        self._tiles.clear()
+        self.bytes_used = 0
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """The counters of the cache, and its hit rate and size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "tiles": len(self._tiles),
+            "memory_mb": self.bytes_used / 1024**2,
+        }
+
+    def _discard(self, key: TileKey) -> bool:
+        entry = self._tiles.pop(key, None)
+        if entry is None:
+            return False
+        self.bytes_used -= entry[1]
+        return True
@@ -5,6 +5,8 @@ from ._canvas_scroller import CanvasScroller
 from ._canvas_click_handler import CanvasClickHandler
 from ._canvas_path_renderer import CanvasPathRenderer
 from ._canvas_pins_renderer import CanvasPinsRenderer
+from ._path_cost_layer import PathCostLayer
+from ._steepness_layer import SteepnessLayer
 from typing import TYPE_CHECKING, Optional, cast
 
 if TYPE_CHECKING:
@@ -14,7 +16,9 @@ if TYPE_CHECKING:
 class MapCanvas(ctk.CTkCanvas):
 
     def __init__(self, parent, **kwargs):
+        from core import map_manager
         from game import game_manager
+        from state_managers import canvas_state_manager
 
         super().__init__(parent, highlightthickness=0, **kwargs)
 
@@ -30,8 +34,12 @@ class MapCanvas(ctk.CTkCanvas):
         self.map_renderer.render_map()
         self.configure(bg="black")
 
+        # The canvas lives as long as the app, so these are registered once.
         game_manager.add_on_path_recalculated_callback(self._path_recalculated_callback)
-        game_manager.add_on_game_start_callback(self._on_new_game_started)
+        map_manager.add_map_recreate_callback(self._on_map_recreated)
+        canvas_state_manager.add_callback("path_loading", self.path_renderer.set_dimmed)
+        canvas_state_manager.add_callback("show_path_costs", self._show_path_costs)
+        canvas_state_manager.add_callback("show_steepness", self._show_steepness)
 
         self.gradient_display: Optional[int] = None
         self.bind("<Motion>", self._on_mouse_motion)
@@ -57,19 +65,32 @@ class MapCanvas(ctk.CTkCanvas):
         Callback for when the pathfinding algorithm generates a new path.
         """
         self.path_renderer.render_path(path.nodes)
+        self.map_renderer.set_path_costs(path.nodes)
+
+    def _show_path_costs(self, show: bool):
+        """Swaps the path line for the path colored by cost, or back."""
+        self.map_renderer.set_layer_visible(PathCostLayer.NAME, show)
+        self.path_renderer.set_hidden(show)
 
-    def _on_new_game_started(self):
+    def _show_steepness(self, show: bool):
+        """Shows or hides the steepness heatmap over the terrain."""
+        self.map_renderer.set_layer_visible(SteepnessLayer.NAME, show)
+
+    def _on_map_recreated(self):
         """
-        Callback for when a new game is started.
+        Callback for when a new map is loaded. The old path is cleared until
+        the new one arrives, and the view is fitted to the new map.
         """
+        self.path_renderer.clear_path()
         self.map_renderer.render_map()
+        self.scroller.configure_zoom()
 
     @property
-    def zoom_level(self) -> int:
+    def zoom_level(self) -> float:
         """The current magnification level of the canvas."""
         return self.camera.zoom_level
 
-    def set_zoom_level(self, value: int, origin_x: int, origin_y: int):
+    def set_zoom_level(self, value: float, origin_x: int, origin_y: int):
         """
         Sets the zoom level by re-rendering and repositioning existing canvas items
         relative to a given origin point.
@@ -84,13 +105,14 @@ class MapCanvas(ctk.CTkCanvas):
         dx = (origin_x - self.scroller.last_x) * (value / old_zoom - 1)
         dy = (origin_y - self.scroller.last_y) * (value / old_zoom - 1)
 
-        self.map_renderer.rescale()
         self.path_renderer.rescale()
         self.pins_renderer.rescale()
 
         self.scroller.last_x -= int(dx)
         self.scroller.last_y -= int(dy)
         self.scan_dragto(self.scroller.last_x, self.scroller.last_y, gain=1)
+        # The terrain is drawn for the viewport, so it follows the scroll.
+        self.map_renderer.rescale()
 
     def canvas_to_map_coords(self, canvas_x: int, canvas_y: int) -> tuple[int, int]:
         """
@@ -143,8 +165,8 @@ class MapCanvas(ctk.CTkCanvas):
 
     def _get_gradient_info(self, map_x: int, map_y: int) -> str:
         """
-        Gets the gradient magnitude (steepness) at the given map coordinates.
-        Uses the available `get_gradient_magnitude_at` method.
+        Gets the gradient magnitude (steepness) at the given map coordinates,
+        looked up in the gradient magnitude raster of the map.
         """
         from core import map_manager
 
@@ -18,8 +18,17 @@ class RestartFrame(ctk.CTkFrame):
         )
         self.restart_button.grid(row=0, column=0, sticky="ne", pady=(4, 0))
 
+        self.daily_challenge_button = ctk.CTkButton(
+            self,
+            text="Daily Challenge",
+            font=("", 16),
+            command=self._start_daily_challenge,
+            width=192,
+        )
+        self.daily_challenge_button.grid(row=1, column=0, sticky="ne", pady=(8, 0))
+
         seed_frame = ctk.CTkFrame(self, fg_color="transparent")
-        seed_frame.grid(row=1, column=0, sticky="ne", pady=(8, 0))
+        seed_frame.grid(row=2, column=0, sticky="ne", pady=(8, 0))
 
         self.seed_label = ctk.CTkLabel(
             seed_frame,
@@ -44,9 +53,17 @@ class RestartFrame(ctk.CTkFrame):
 
     def _update_button_state(self, can_interact: bool):
         """Enables or disables the restart button based on player interaction state."""
+        from core import map_manager
+
         state = "normal" if can_interact else "disabled"
         self.restart_button.configure(state=state)
 
+        # The daily challenge needs a map library to pick the map from.
+        has_library = map_manager.map_library is not None
+        self.daily_challenge_button.configure(
+            state=state if has_library else "disabled"
+        )
+
     def _validate_seed_input(self, new_value: str) -> bool:
         """Ensures that the entry only contains digits or is empty."""
         return new_value.isdigit() or new_value == ""
@@ -60,3 +77,11 @@ class RestartFrame(ctk.CTkFrame):
             seed = int(seed_str)
 
         game_manager.start_new_game(seed=seed)
+
+    def _start_daily_challenge(self):
+        from core import map_manager
+        from game import game_manager
+
+        seed = map_manager.daily_challenge_seed()
+        if seed is not None:
+            game_manager.start_new_game(seed=seed)
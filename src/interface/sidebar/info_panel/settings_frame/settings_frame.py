@@ -1,5 +1,5 @@
+import math
 import customtkinter as ctk
-from config import config
 from typing import cast
 
 
@@ -9,6 +9,7 @@ class SettingsFrame(ctk.CTkFrame):
         super().__init__(parent, fg_color="transparent")
 
         self.after(300, self._pack_zoom_slider)
+        self.after(300, self._pack_overlay_switches)
 
     def _pack_zoom_slider(self):
         from state_managers import canvas_state_manager
@@ -19,22 +20,28 @@ class SettingsFrame(ctk.CTkFrame):
         zoom_label = ctk.CTkLabel(zoom_container, text="Zoom", font=("", 16))
         zoom_label.pack(padx=(0, 4))
 
-        number_of_steps = (
-            config.canvas.ZOOM_RIGHT_OFFSET + config.canvas.ZOOM_LEFT_OFFSET
-        ) // config.canvas.STEPS_PER_SCROLL
         zoom_slider = ctk.CTkSlider(
             zoom_container,
             from_=0,
-            to=config.canvas.ZOOM_LEFT_OFFSET + config.canvas.ZOOM_RIGHT_OFFSET,
-            number_of_steps=int(number_of_steps),
+            to=1,
+            number_of_steps=1,
             width=128,
             command=self._handle_zoom,
         )
         zoom_slider.pack(fill="x")
 
+        def _set_range(_):
+            # The slider spans the zooms the canvas allows, recomputed on
+            # every resize and new map.
+            steps = max(1, round(self._zoom_to_slider_zoom(self._max_zoom())))
+            zoom_slider.configure(to=steps, number_of_steps=steps)
+            _callback(canvas_state_manager.vars["zoom"].get())
+
         def _callback(value):
-            zoom_slider.set(self._actual_zoom_to_slider_zoom(value))
+            zoom_slider.set(self._zoom_to_slider_zoom(value))
 
+        canvas_state_manager.add_callback("min_zoom", _set_range)
+        canvas_state_manager.add_callback("max_zoom", _set_range)
         canvas_state_manager.add_callback("zoom", _callback)
 
         # Code to test emoji pin quicker. This should be removed in the future.
@@ -47,28 +54,54 @@ class SettingsFrame(ctk.CTkFrame):
         # emoji_pin_label = ctk.CTkLabel(zoom_container, image=ctk_image, text="")
         # emoji_pin_label.pack()
 
+    def _pack_overlay_switches(self):
+        from state_managers import canvas_state_manager
+
+        path_costs_switch = ctk.CTkSwitch(
+            self,
+            text="Path cost",
+            variable=canvas_state_manager.vars["show_path_costs"],
+        )
+        path_costs_switch.pack(anchor="w", pady=(8, 0))
+
+        steepness_switch = ctk.CTkSwitch(
+            self,
+            text="Steepness",
+            variable=canvas_state_manager.vars["show_steepness"],
+        )
+        steepness_switch.pack(anchor="w", pady=(8, 0))
+
     def _handle_zoom(self, value: float):
         from state_managers import canvas_state_manager
 
         zoom_var = cast(ctk.DoubleVar, canvas_state_manager.vars["zoom"])
         zoom_var.set(self._slider_zoom_to_actual_zoom(value))
 
-    def _actual_zoom_to_slider_zoom(self, zoom: float):
+    @staticmethod
+    def _min_zoom() -> float:
         from state_managers import canvas_state_manager
 
-        initial_zoom_var = cast(
-            ctk.DoubleVar, canvas_state_manager.vars["initial_zoom"]
-        )
-        min_zoom = initial_zoom_var.get() - config.canvas.ZOOM_LEFT_OFFSET
-
-        return zoom - min_zoom
+        return cast(ctk.DoubleVar, canvas_state_manager.vars["min_zoom"]).get()
 
-    def _slider_zoom_to_actual_zoom(self, zoom: float):
+    @staticmethod
+    def _max_zoom() -> float:
         from state_managers import canvas_state_manager
 
-        initial_zoom_var = cast(
-            ctk.DoubleVar, canvas_state_manager.vars["initial_zoom"]
-        )
-        min_zoom = initial_zoom_var.get() - config.canvas.ZOOM_LEFT_OFFSET
+        return cast(ctk.DoubleVar, canvas_state_manager.vars["max_zoom"]).get()
+
+    def _zoom_to_slider_zoom(self, zoom: float) -> float:
+        """
+        The slider position of a zoom. Each step is a whole zoom level from
+        1 up and a halving of the zoom below 1, so every zoom the canvas can
+        show is one step from the next, starting from its minimum zoom at 0.
+        """
+        return _zoom_steps(zoom) - _zoom_steps(self._min_zoom())
+
+    def _slider_zoom_to_actual_zoom(self, value: float) -> float:
+        steps = value + _zoom_steps(self._min_zoom())
+        return steps + 1 if steps >= 0 else 2.0**steps
+
 
-        return zoom + min_zoom
+def _zoom_steps(zoom: float) -> float:
+    """How many slider steps a zoom is above a zoom of 1."""
+    return zoom - 1 if zoom >= 1 else math.log2(zoom)
@@ -0,0 +1,60 @@
+import argparse
+import json
+from terrain_map.generator.sweep import parameter_grid, run_sweep
+from config import config
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=(
+            "Generate maps for every combination of generator settings and "
+            "report timings and terrain statistics."
+        )
+    )
+    parser.add_argument(
+        "grid",
+        help=(
+            "Path to a JSON file mapping generator settings to lists of values, "
+            'e.g. {"trap_density": [0.002, 0.004], "ridge_octaves": [5, 7]}.'
+        ),
+    )
+    parser.add_argument(
+        "--seeds",
+        type=int,
+        nargs="+",
+        default=[0, 1, 2],
+        help="Seeds to generate for every combination. Defaults to 0 1 2.",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Number of worker processes. Defaults to one per CPU.",
+    )
+    parser.add_argument(
+        "--output",
+        help="Optional path of a JSON file to write every run to.",
+    )
+    args = parser.parse_args()
+
+    with open(args.grid, "r") as f:
+        config_overrides = parameter_grid(**json.load(f))
+
+    MAP_WIDTH = config.MAP_WIDTH
+    MAP_HEIGHT = config.MAP_HEIGHT
+
+    print(
+        f"--- Sweeping {len(config_overrides)} configurations x "
+        f"{len(args.seeds)} seeds ({MAP_WIDTH}x{MAP_HEIGHT}) ---"
+    )
+    runs = run_sweep(
+        config_overrides, MAP_WIDTH, MAP_HEIGHT, args.seeds, args.processes
+    )
+
+    for run in runs:
+        stats = ", ".join(f"{name}={value:.2f}" for name, value in run.stats.items())
+        print(f"{run.config_override} seed={run.seed} {run.seconds:.3f}s {stats}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump([vars(run) for run in runs], f, indent=2)
+        print(f"Runs saved to {args.output}")
@@ -1,3 +1,6 @@
+from . import precision
 from .terrain_map import TerrainMap
+from . import map_file
+from . import dem
 
-__all__ = ["TerrainMap"]
+__all__ = ["TerrainMap", "precision", "map_file", "dem"]
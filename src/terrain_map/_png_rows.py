@@ -0,0 +1,251 @@
+import struct
+import zlib
+import numpy as np
+from collections.abc import Iterator
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+GRAYSCALE = 0
+READ_SIZE = 1 << 16
+# Images whose decoded pixels fit in this many bytes are decoded whole by
+# Pillow, which is much faster than unfiltering them here row by row.
+IN_MEMORY_BYTES = 128 * 1024 * 1024
+
+
+class PngInfo:
+    """The parts of a PNG header needed to decode its rows."""
+
+    def __init__(self, width: int, height: int, bit_depth: int):
+        self.width = width
+        self.height = height
+        self.bit_depth = bit_depth
+
+    @property
+    def bytes_per_pixel(self) -> int:
+        return self.bit_depth // 8
+
+    @property
+    def row_bytes(self) -> int:
+        return self.width * self.bytes_per_pixel
+
+
+def _read_info(f) -> PngInfo:
+    if f.read(8) != PNG_SIGNATURE:
+        raise ValueError("Not a PNG file.")
+
+    length, chunk_type = struct.unpack(">I4s", f.read(8))
+    if chunk_type != b"IHDR":
+        raise ValueError("PNG file doesn't start with a header.")
+    width, height, bit_depth, color_type, _, _, interlace = struct.unpack(
+        ">IIBBBBB", f.read(length)
+    )
+    f.read(4)  # CRC
+
+    if color_type != GRAYSCALE or bit_depth not in (8, 16) or interlace:
+        raise ValueError(
+            "Only non-interlaced 8 or 16-bit grayscale PNGs are supported."
+        )
+    return PngInfo(width, height, bit_depth)
+
+
+def read_png_info(filepath) -> PngInfo:
+    """Reads the size and bit depth of a grayscale PNG."""
+    with open(filepath, "rb") as f:
+        return _read_info(f)
+
+
+# Scanlines are decoded in bands of up to this many rows. A band holding any
+# row filtered with Average or Paeth is decoded as a whole, and this is how
+# many pixels each of its vectorized steps works on.
+BAND_ROWS = 256
+
+
+def _paeth_predictor(left: np.ndarray, up: np.ndarray, up_left: np.ndarray):
+    estimate = left + up - up_left
+    distance_left = np.abs(estimate - left)
+    distance_up = np.abs(estimate - up)
+    distance_up_left = np.abs(estimate - up_left)
+    return np.where(
+        (distance_left <= distance_up) & (distance_left <= distance_up_left),
+        left,
+        np.where(distance_up <= distance_up_left, up, up_left),
+    )
+
+
+def _unfilter_wavefront(
+    filter_types: np.ndarray, raw: np.ndarray, previous: np.ndarray, bpp: int
+) -> np.ndarray:
+    """
+    Reverses the filters of a band of scanlines, given the row decoded
+    before them. Returns the decoded (rows, row bytes) array.
+
+    With the Average (3) and Paeth (4) filters, each pixel depends on the
+    decoded pixels to its left, above it and above-left of it, so they
+    can't be undone one whole row at a time. All pixels on an anti-diagonal
+    of the band depend only on the two diagonals before it, though, so the
+    band is decoded a diagonal at a time, every step covering a pixel of
+    each row, whatever its filter.
+    """
+    rows = len(raw)
+    width = raw.shape[1] // bpp
+    if np.any(filter_types > 4):
+        raise ValueError(f"Invalid PNG filter type {filter_types.max()}.")
+
+    # The band is stored skewed and transposed, with pixel w of row r (row 0
+    # being the previous row) at [r + w + 1, r]. Each diagonal is then one
+    # contiguous slice, and its neighbors are the two slices before it.
+    # Cells left of the image stay zero, as the filters expect.
+    skewed_rows = np.arange(1, rows + 1)[:, None]
+    diagonals = skewed_rows + np.arange(width)[None, :] + 1
+    skewed_raw = np.zeros((rows + width + 1, rows + 1, bpp), dtype=np.int16)
+    skewed_raw[diagonals, skewed_rows] = raw.reshape(rows, width, bpp)
+    decoded = np.zeros_like(skewed_raw)
+    decoded[1 : width + 1, 0] = previous.reshape(width, bpp)
+
+    filter_types = filter_types[:, None]
+    for diagonal in range(2, rows + width + 1):
+        left = decoded[diagonal - 1, 1:]
+        up = decoded[diagonal - 1, :-1]
+        up_left = decoded[diagonal - 2, :-1]
+
+        predictor = np.choose(
+            filter_types,
+            (0, left, up, (left + up) >> 1, _paeth_predictor(left, up, up_left)),
+        )
+        decoded[diagonal, 1:] = (skewed_raw[diagonal, 1:] + predictor) & 0xFF
+
+    pixels = decoded[diagonals, skewed_rows]
+    return pixels.reshape(rows, -1).astype(np.uint8)
+
+
+def _unfilter(
+    filter_type: int, raw: bytes, previous: np.ndarray, bpp: int
+) -> np.ndarray:
+    """Reverses the filter of a single scanline, given the previous one."""
+    row = np.frombuffer(raw, dtype=np.uint8)
+    if filter_type == 0:
+        return row.copy()
+    if filter_type == 1:
+        # Each byte adds the decoded byte one pixel to its left, which is a
+        # running sum (mod 256) over every byte lane of the pixels.
+        lanes = row.reshape(-1, bpp)
+        return np.cumsum(lanes, axis=0, dtype=np.uint8).reshape(-1)
+    if filter_type == 2:
+        return row + previous
+    if filter_type in (3, 4):
+        filter_types = np.array([filter_type])
+        return _unfilter_wavefront(filter_types, row[None], previous, bpp)[0]
+    raise ValueError(f"Invalid PNG filter type {filter_type}.")
+
+
+def _compressed_data(f, read_size: int) -> Iterator[bytes]:
+    """Yields the compressed image data of the IDAT chunks, piece by piece."""
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            raise ValueError("PNG file ended before its image data.")
+
+        length, chunk_type = struct.unpack(">I4s", chunk_header)
+        if chunk_type == b"IEND":
+            return
+        if chunk_type != b"IDAT":
+            f.seek(length + 4, 1)
+            continue
+
+        remaining = length
+        while remaining > 0:
+            data = f.read(min(remaining, read_size))
+            if not data:
+                raise ValueError("PNG file is truncated.")
+            remaining -= len(data)
+            yield data
+        f.read(4)  # CRC
+
+
+def _scanlines(f, info: PngInfo, read_size: int) -> Iterator[tuple[int, bytes]]:
+    """Yields the (filter type, filtered bytes) of every scanline, in order."""
+    scanline_bytes = info.row_bytes + 1
+    decompressor = zlib.decompressobj()
+    pending = bytearray()
+    rows_read = 0
+
+    for data in _compressed_data(f, read_size):
+        pending += decompressor.decompress(data)
+
+        position = 0
+        while len(pending) - position >= scanline_bytes:
+            filter_type = pending[position]
+            raw = bytes(pending[position + 1 : position + scanline_bytes])
+            position += scanline_bytes
+
+            yield filter_type, raw
+            rows_read += 1
+            if rows_read == info.height:
+                return
+        del pending[:position]
+
+    raise ValueError("PNG file ended before its last row.")
+
+
+def _read_in_memory(filepath, info: PngInfo) -> Iterator[np.ndarray]:
+    from PIL import Image
+
+    row_dtype = np.uint16 if info.bit_depth == 16 else np.uint8
+    with Image.open(filepath) as image:
+        pixels = np.asarray(image).astype(row_dtype, copy=False)
+    yield from pixels
+
+
+def read_png_rows(filepath, read_size: int = READ_SIZE) -> Iterator[np.ndarray]:
+    """
+    Yields the rows of a non-interlaced 8 or 16-bit grayscale PNG one at a
+    time, as uint8 or uint16 arrays. Only a few rows and the compressed data
+    around them are held in memory, so images of any size can be streamed.
+
+    Images smaller than IN_MEMORY_BYTES are decoded whole by Pillow instead.
+    Otherwise scanlines are read in bands of BAND_ROWS. Bands filtered only
+    with None, Sub or Up are decoded one row at a time; the others as a whole.
+    """
+    info = read_png_info(filepath)
+    if info.height * info.row_bytes <= IN_MEMORY_BYTES:
+        yield from _read_in_memory(filepath, info)
+        return
+
+    with open(filepath, "rb") as f:
+        info = _read_info(f)
+        row_dtype = np.dtype(">u2") if info.bit_depth == 16 else np.dtype(np.uint8)
+        bpp = info.bytes_per_pixel
+        previous = np.zeros(info.row_bytes, dtype=np.uint8)
+        band_types: list[int] = []
+        band_raw: list[bytes] = []
+
+        def decode_band() -> Iterator[np.ndarray]:
+            nonlocal previous
+            if max(band_types) <= 2:
+                for filter_type, raw in zip(band_types, band_raw):
+                    previous = _unfilter(filter_type, raw, previous, bpp)
+                    yield to_row(previous)
+            else:
+                raw = np.frombuffer(b"".join(band_raw), dtype=np.uint8)
+                decoded = _unfilter_wavefront(
+                    np.array(band_types),
+                    raw.reshape(len(band_raw), -1),
+                    previous,
+                    bpp,
+                )
+                previous = decoded[-1]
+                for row in decoded:
+                    yield to_row(row)
+            band_types.clear()
+            band_raw.clear()
+
+        def to_row(decoded: np.ndarray) -> np.ndarray:
+            return decoded.view(row_dtype).astype(row_dtype.newbyteorder("="))
+
+        for filter_type, raw in _scanlines(f, info, read_size):
+            band_types.append(filter_type)
+            band_raw.append(raw)
+            if len(band_raw) == BAND_ROWS:
+                yield from decode_band()
+
+        if band_raw:
+            yield from decode_band()
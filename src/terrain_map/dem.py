@@ -0,0 +1,182 @@
+import numpy as np
+from collections.abc import Iterator
+from pathlib import Path
+from config import config
+from .precision import normalize_to_255
+from .terrain_map import TerrainMap
+from ._png_rows import read_png_info, read_png_rows
+
+# Elevation models are read in bands of this many rows, so even sources
+# far larger than memory only ever hold one band at a time.
+BAND_ROWS = 256
+SUPPORTED_SUFFIXES = (".npy", ".png")
+FIT_MODES = ("resample", "crop")
+
+
+def _read_npy_size(filepath: Path) -> tuple[int, int]:
+    elevations = np.load(filepath, mmap_mode="r")
+    if elevations.ndim != 2:
+        raise ValueError(
+            f"Elevation model must be a 2D array, got {elevations.ndim} dimensions."
+        )
+    return elevations.shape
+
+
+def read_dem_size(filepath: str | Path) -> tuple[int, int]:
+    """Reads the (height, width) of an elevation model without loading it."""
+    filepath = Path(filepath)
+    suffix = filepath.suffix.lower()
+    if suffix == ".npy":
+        return _read_npy_size(filepath)
+    if suffix == ".png":
+        info = read_png_info(filepath)
+        return info.height, info.width
+    raise ValueError(
+        f"Unsupported elevation model '{filepath.name}'. "
+        f"Expected one of: {', '.join(SUPPORTED_SUFFIXES)}."
+    )
+
+
+def _read_bands(
+    filepath: Path, rows: slice, cols: slice, band_rows: int
+) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Yields the (rows, cols) window of an elevation model in bands of rows,
+    as (first row of the band within the window, float64 band).
+    """
+    if filepath.suffix.lower() == ".npy":
+        # Memory-mapped, so only the pages holding each band are read.
+        elevations = np.load(filepath, mmap_mode="r")
+        for start in range(rows.start, rows.stop, band_rows):
+            stop = min(start + band_rows, rows.stop)
+            yield start - rows.start, np.asarray(
+                elevations[start:stop, cols], dtype=np.float64
+            )
+        return
+
+    band: list[np.ndarray] = []
+    band_start = 0
+    for row_index, row in enumerate(read_png_rows(filepath)):
+        if row_index < rows.start:
+            continue
+        if row_index >= rows.stop:
+            break
+        band.append(row[cols])
+        if len(band) == band_rows:
+            yield band_start, np.array(band, dtype=np.float64)
+            band_start += len(band)
+            band = []
+    if band:
+        yield band_start, np.array(band, dtype=np.float64)
+
+
+def _bin_starts(source_size: int, target_size: int) -> np.ndarray:
+    """
+    Returns, for each source index, the target index it falls into when
+    `source_size` cells are split into `target_size` equal-as-possible bins.
+    """
+    return (np.arange(source_size) * target_size) // source_size
+
+
+def _block_mean(
+    bands: Iterator[tuple[int, np.ndarray]],
+    source_shape: tuple[int, int],
+    target_shape: tuple[int, int],
+    nodata: float | None,
+) -> np.ndarray:
+    """
+    Downsamples bands of elevations by averaging every source cell that
+    falls into each target cell. Missing values (NaN, or `nodata`) are left
+    out of the averages; target cells with no valid source cell are NaN.
+    """
+    target_height, target_width = target_shape
+    row_bins = _bin_starts(source_shape[0], target_height)
+    col_bins = _bin_starts(source_shape[1], target_width)
+    col_starts = np.flatnonzero(np.diff(col_bins, prepend=-1))
+
+    sums = np.zeros(target_shape)
+    counts = np.zeros(target_shape)
+
+    for band_start, band in bands:
+        valid = np.isfinite(band)
+        if nodata is not None:
+            valid &= band != nodata
+        values = np.where(valid, band, 0.0)
+
+        # Reduce the columns of every row first, then the rows of the band
+        # that fall into the same target row.
+        band_sums = np.add.reduceat(values, col_starts, axis=1)
+        band_counts = np.add.reduceat(valid, col_starts, axis=1, dtype=np.int64)
+
+        band_row_bins = row_bins[band_start : band_start + len(band)]
+        row_starts = np.flatnonzero(np.diff(band_row_bins, prepend=-1))
+        target_rows = band_row_bins[row_starts]
+        sums[target_rows] += np.add.reduceat(band_sums, row_starts, axis=0)
+        counts[target_rows] += np.add.reduceat(band_counts, row_starts, axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def load_dem(
+    filepath: str | Path,
+    width: int | None = None,
+    height: int | None = None,
+    fit: str = "resample",
+    offset: tuple[int, int] = (0, 0),
+    nodata: float | None = None,
+    band_rows: int = BAND_ROWS,
+) -> TerrainMap:
+    """
+    Loads a digital elevation model from a raw `.npy` array or a 16-bit
+    grayscale PNG into a TerrainMap of `width` x `height` cells (the map
+    size in the config by default).
+
+    The source is streamed in bands of `band_rows` rows, so it never has to
+    fit in memory. With `fit="resample"` the whole source is downsampled by
+    averaging the cells that fall into each map cell. With `fit="crop"` a
+    window of the map size is cut out at the (x, y) `offset`, at full
+    resolution. Either way the elevations are then normalized like generated
+    maps: stretched to 0-255 and quantized to the storage dtype.
+
+    NaN elevations, and those equal to `nodata`, are treated as missing and
+    filled with the lowest elevation. The map has no seed.
+    """
+    filepath = Path(filepath)
+    width = width or config.MAP_WIDTH
+    height = height or config.MAP_HEIGHT
+    if fit not in FIT_MODES:
+        raise ValueError(
+            f"Unknown fit mode '{fit}'. Expected one of: {', '.join(FIT_MODES)}."
+        )
+
+    source_height, source_width = read_dem_size(filepath)
+    if source_width < width or source_height < height:
+        raise ValueError(
+            f"Elevation model is {source_width}x{source_height}, smaller than "
+            f"the {width}x{height} map."
+        )
+
+    if fit == "crop":
+        x, y = offset
+        if not (0 <= x <= source_width - width and 0 <= y <= source_height - height):
+            raise ValueError(
+                f"A {width}x{height} crop at ({x}, {y}) doesn't fit in the "
+                f"{source_width}x{source_height} elevation model."
+            )
+        rows, cols = slice(y, y + height), slice(x, x + width)
+    else:
+        rows, cols = slice(0, source_height), slice(0, source_width)
+
+    # Cropping is a resample where every map cell covers one source cell.
+    bands = _read_bands(filepath, rows, cols, band_rows)
+    window_shape = (rows.stop - rows.start, cols.stop - cols.start)
+    elevations = _block_mean(bands, window_shape, (height, width), nodata)
+
+    missing = np.isnan(elevations)
+    if missing.all():
+        raise ValueError("Elevation model has no valid elevations.")
+    if missing.any():
+        elevations[missing] = np.min(elevations[~missing])
+
+    return TerrainMap(normalize_to_255(elevations))
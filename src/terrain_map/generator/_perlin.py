@@ -0,0 +1,131 @@
+import numpy as np
+
+# Ken Perlin's reference permutation, repeated so that PERM[A + j] never
+# needs wrapping. Identical to the table shipped with the 'noise' library.
+# fmt: off
+_PERMUTATION = [
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
+    140, 36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148, 247,
+    120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32, 57, 177,
+    33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175, 74, 165,
+    71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122, 60, 211,
+    133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54, 65, 25, 63,
+    161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169, 200, 196, 135,
+    130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64, 52, 217, 226,
+    250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212, 207, 206, 59,
+    227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213, 119, 248, 152,
+    2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9, 129, 22, 39, 253,
+    19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104, 218, 246, 97, 228,
+    251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241, 81, 51, 145, 235,
+    249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157, 184, 84, 204, 176,
+    115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93, 222, 114, 67, 29,
+    24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+]
+# fmt: on
+PERM = np.array(_PERMUTATION * 2, dtype=np.intp)
+
+# The first two components of the 16 GRAD3 vectors used by noise2.
+GRAD2_X = np.array(
+    [1, -1, 1, -1, 1, -1, 1, -1, 0, 0, 0, 0, 1, -1, 0, 0], dtype=np.float32
+)
+GRAD2_Y = np.array(
+    [1, 1, -1, -1, 0, 0, 0, 0, 1, -1, 1, -1, 0, 0, -1, 1], dtype=np.float32
+)
+
+
+def _lerp(t: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return a + t * (b - a)
+
+
+def _fade(t: np.ndarray) -> np.ndarray:
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+def _grad2(hash_values: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    h = hash_values & 15
+    return x * GRAD2_X[h] + y * GRAD2_Y[h]
+
+
+def _noise2(
+    x: np.ndarray,
+    y: np.ndarray,
+    repeatx: np.float32,
+    repeaty: np.float32,
+    base: int,
+) -> np.ndarray:
+    """A single octave of 2D Perlin noise over float32 coordinate arrays."""
+    i = np.floor(np.fmod(x, repeatx)).astype(np.int32)
+    j = np.floor(np.fmod(y, repeaty)).astype(np.int32)
+    ii = np.fmod((i + 1).astype(np.float32), repeatx).astype(np.int32)
+    jj = np.fmod((j + 1).astype(np.float32), repeaty).astype(np.int32)
+    i = (i & 255) + base
+    j = (j & 255) + base
+    ii = (ii & 255) + base
+    jj = (jj & 255) + base
+
+    x = x - np.floor(x)
+    y = y - np.floor(y)
+    fx = _fade(x)
+    fy = _fade(y)
+
+    a = PERM[i]
+    aa = PERM[a + j]
+    ab = PERM[a + jj]
+    b = PERM[ii]
+    ba = PERM[b + j]
+    bb = PERM[b + jj]
+
+    x1 = x - 1
+    y1 = y - 1
+    return _lerp(
+        fy,
+        _lerp(fx, _grad2(PERM[aa], x, y), _grad2(PERM[ba], x1, y)),
+        _lerp(fx, _grad2(PERM[ab], x, y1), _grad2(PERM[bb], x1, y1)),
+    )
+
+
+def pnoise2(
+    x: np.ndarray,
+    y: np.ndarray,
+    octaves: int = 1,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+    repeatx: float = 1024,
+    repeaty: float = 1024,
+    base: int = 0,
+) -> np.ndarray:
+    """
+    Vectorized equivalent of 'noise.pnoise2' that evaluates fractal (fBm)
+    Perlin noise over whole coordinate arrays at once.
+
+    The arithmetic is carried out in float32, in the same order as the C
+    implementation, so results match the library's per-point output for the
+    same inputs (up to float32 rounding).
+    """
+    if octaves < 1:
+        raise ValueError("Expected octaves value > 0")
+
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    repeatx_f = np.float32(repeatx)
+    repeaty_f = np.float32(repeaty)
+
+    if octaves == 1:
+        return _noise2(x, y, repeatx_f, repeaty_f, base).astype(np.float64)
+
+    persistence_f = np.float32(persistence)
+    lacunarity_f = np.float32(lacunarity)
+    freq = np.float32(1.0)
+    amp = np.float32(1.0)
+    max_amp = np.float32(0.0)
+    total = np.zeros(np.broadcast_shapes(x.shape, y.shape), dtype=np.float32)
+
+    for _ in range(octaves):
+        total += (
+            _noise2(x * freq, y * freq, repeatx_f * freq, repeaty_f * freq, base) * amp
+        )
+        max_amp += amp
+        freq *= lacunarity_f
+        amp *= persistence_f
+
+    return (total / max_amp).astype(np.float64)
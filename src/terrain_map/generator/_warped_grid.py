@@ -0,0 +1,73 @@
+import numpy as np
+
+# Per-row extent of the warped x coordinates and per-column extent of the
+# warped y coordinates, as (x_min, x_max, y_min, y_max).
+WarpExtents = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class WarpedGrid:
+    """
+    The domain-warped coordinate grid shared by every trap and ridge.
+
+    Besides the warped coordinates themselves, it keeps the extent of the
+    warped x coordinates along each row and of the warped y coordinates
+    along each column. These let a feature find the window of the grid it
+    can reach without scanning the whole map.
+
+    A grid may also be a tile of a larger map. In that case `extents` are
+    the extents of the whole map and `origin` is the (row, column) of the
+    tile's first point, so windows are decided exactly as they would be on
+    the full grid.
+    """
+
+    def __init__(
+        self,
+        xx_warped: np.ndarray,
+        yy_warped: np.ndarray,
+        extents: WarpExtents | None = None,
+        origin: tuple[int, int] = (0, 0),
+    ):
+        self.xx = xx_warped
+        self.yy = yy_warped
+        self.origin = origin
+
+        if extents is None:
+            extents = self.extents_of(xx_warped, yy_warped)
+        self.x_min, self.x_max, self.y_min, self.y_max = extents
+
+    @staticmethod
+    def extents_of(xx_warped: np.ndarray, yy_warped: np.ndarray) -> WarpExtents:
+        """Computes the row and column extents of a warped grid."""
+        # xx varies along axis 0 and yy along axis 1 (meshgrid "ij" indexing).
+        return (
+            xx_warped.min(axis=1),
+            xx_warped.max(axis=1),
+            yy_warped.min(axis=0),
+            yy_warped.max(axis=0),
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.xx.shape
+
+    def window(self, cx: float, cy: float, radius: float) -> tuple[slice, slice] | None:
+        """
+        Returns the smallest (rows, columns) window holding every point whose
+        warped coordinates lie within `radius` of (cx, cy) on both axes, or
+        None if no point of this grid does.
+        """
+        rows = np.flatnonzero((self.x_max >= cx - radius) & (self.x_min <= cx + radius))
+        cols = np.flatnonzero((self.y_max >= cy - radius) & (self.y_min <= cy + radius))
+
+        if rows.size == 0 or cols.size == 0:
+            return None
+
+        row_start = max(rows[0] - self.origin[0], 0)
+        row_stop = min(rows[-1] + 1 - self.origin[0], self.shape[0])
+        col_start = max(cols[0] - self.origin[1], 0)
+        col_stop = min(cols[-1] + 1 - self.origin[1], self.shape[1])
+
+        if row_start >= row_stop or col_start >= col_stop:
+            return None
+
+        return slice(row_start, row_stop), slice(col_start, col_stop)
@@ -1,6 +1,76 @@
+import hashlib
+import json
 from pathlib import Path
+from types import MappingProxyType
 from utils import Config
 
 _config_dir = Path(__file__).parent
 generator_config_path = _config_dir / "generator_config.json"
-generator_config = Config(generator_config_path)
+
+
+def generator_config_hash() -> str:
+    """A short hash identifying the contents of generator_config.json."""
+    return hashlib.sha1(generator_config_path.read_bytes()).hexdigest()[:12]
+
+
+class GeneratorConfig(Config):
+    """
+    An immutable snapshot of the settings in generator_config.json, with
+    optional overrides applied on top. Each MapGenerator owns one, so
+    generators with different settings never affect each other.
+
+    Overrides are validated against the file: unknown settings, values of
+    the wrong type and min/max pairs in the wrong order raise a ValueError.
+    """
+
+    def __init__(self, config_override: dict | None = None):
+        with open(generator_config_path, "r", encoding="utf-8") as f:
+            settings = json.load(f)
+
+        for key, value in (config_override or {}).items():
+            settings[key.lower()] = self._validate_override(key, value, settings)
+        self._validate_ranges(settings)
+
+        super().__init__(settings)
+        self._data = MappingProxyType(settings)
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get("_frozen"):
+            raise AttributeError("Generator configurations are immutable.")
+        super().__setattr__(name, value)
+
+    def __reduce__(self):
+        # The settings are re-validated when unpickled in a worker process.
+        return (GeneratorConfig, (dict(self._data),))
+
+    @staticmethod
+    def _validate_override(key: str, value, settings: dict):
+        name = key.lower()
+        if name not in settings:
+            raise ValueError(f"Unknown generator setting '{key}'.")
+
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(
+                f"Generator setting '{key}' must be a number, got {value!r}."
+            )
+        if isinstance(settings[name], int):
+            if not isinstance(value, int):
+                raise ValueError(
+                    f"Generator setting '{key}' must be an integer, got {value!r}."
+                )
+            return value
+        return float(value)
+
+    @staticmethod
+    def _validate_ranges(settings: dict):
+        for name, low in settings.items():
+            if not name.endswith("_min"):
+                continue
+
+            max_name = name.removesuffix("_min") + "_max"
+            if max_name in settings and low > settings[max_name]:
+                raise ValueError(
+                    f"Generator setting '{name}' ({low}) is greater than "
+                    f"'{max_name}' ({settings[max_name]})."
+                )
@@ -1,30 +1,153 @@
 import numpy as np
 import random
-import noise
+import time
+from collections.abc import Iterator
+from multiprocessing import Pool
 from terrain_map import TerrainMap
-from .generator_config import generator_config
+from terrain_map.precision import normalize_to_255
+from .generator_config import GeneratorConfig
+from ._erosion import erode
+from ._perlin import pnoise2
+from ._warped_grid import WarpedGrid, WarpExtents
+
+# A trap or ridge, as (center_x, center_y, amplitude, width).
+Feature = tuple[float, float, float, float]
+
+
+def _tile_extents_worker(job) -> WarpExtents:
+    """
+    Worker function to run in a process pool.
+    Computes the warp extents of a single tile.
+    """
+    config_override, seed_offsets, width, height, rows, cols = job
+
+    generator = MapGenerator(config_override)
+    generator.seed_x_offset, generator.seed_y_offset = seed_offsets
+
+    xx, yy = generator._create_coordinate_grid(width, height, rows, cols)
+    warped_grid = generator._generate_warped_grid(xx, yy)
+    return warped_grid.x_min, warped_grid.x_max, warped_grid.y_min, warped_grid.y_max
+
+
+def _tile_layers_worker(job) -> np.ndarray:
+    """
+    Worker function to run in a process pool.
+    Combines every noise layer over a single tile, given the warp extents of
+    the whole map.
+    """
+    config_override, seed_offsets, width, height, rows, cols = job[:6]
+    extents, traps, ridges = job[6:]
+
+    generator = MapGenerator(config_override)
+    generator.seed_x_offset, generator.seed_y_offset = seed_offsets
+
+    xx, yy = generator._create_coordinate_grid(width, height, rows, cols)
+    warped_grid = generator._generate_warped_grid(
+        xx, yy, extents=extents, origin=(rows.start, cols.start)
+    )
+    return generator._combine_layers(xx, yy, warped_grid, traps, ridges)
+
 
 class MapGenerator:
     """
-    Generates a TerrainMap by combining multiple layers of noise
-    using the high-speed 'noise' (pynoise) C-accelerated library.
+    Generates a TerrainMap by combining multiple layers of noise.
+    Perlin noise is evaluated over whole coordinate grids at once with a
+    vectorized port of the 'noise' (pynoise) library, so shared seeds keep
+    producing the same maps.
     """
 
+    # Sampling strides of the levels generate_progressive() yields by default.
+    PREVIEW_STRIDES = (8, 4, 2, 1)
+
     def __init__(self, config_override=None):
-        self.config = generator_config
-        if config_override:
-            for key, value in config_override.items():
-                if hasattr(self.config, key):
-                    setattr(self.config, key, value)
-                else:
-                    print(f"Warning: Config override key '{key}' not found.")
+        # Each generator works on its own snapshot of the configuration, so
+        # overrides never leak into other generators.
+        self.config = GeneratorConfig(config_override)
+        self.config_override = config_override
 
         self.seed_x_offset = 0
         self.seed_y_offset = 0
 
-    def generate(self, width: int, height: int, seed: int | None = None):
+        # Timings (in seconds) of the stages of the last generated map.
+        self.stats: dict[str, float] = {}
+
+    def generate(
+        self,
+        width: int,
+        height: int,
+        seed: int | None = None,
+        tile_size: int | None = None,
+        processes: int | None = None,
+    ):
         """
         The main public method. Generates and returns a new TerrainMap.
+
+        If `tile_size` is given, the map is split into tiles of that size that
+        are generated in a pool of `processes` worker processes (one per CPU
+        by default) and stitched back together. The result is bit-identical
+        to generating the map in a single process.
+
+        The time taken by each stage is recorded in `stats`.
+        """
+        self.stats = {}
+        start = time.perf_counter()
+
+        # 1. Place the traps and ridges
+        seed, traps, ridges = self._place_features(width, height, seed)
+
+        # 2. Generate and combine all noise layers
+        if tile_size is None:
+            total_map_float = self._generate_strided(width, height, traps, ridges)
+        else:
+            total_map_float = self._generate_tiled(
+                width, height, traps, ridges, tile_size, processes
+            )
+        self.stats["layers_seconds"] = time.perf_counter() - start
+
+        # 3. Erode the terrain
+        total_map_float = self._apply_erosion(total_map_float, seed)
+
+        # 4. Normalize the final map and create TerrainMap object
+        normalized_map = self._normalize_to_255(total_map_float)
+        self.stats["total_seconds"] = time.perf_counter() - start
+
+        return TerrainMap(normalized_map, seed=seed)
+
+    def generate_progressive(
+        self,
+        width: int,
+        height: int,
+        seed: int | None = None,
+        strides: tuple[int, ...] = PREVIEW_STRIDES,
+    ) -> Iterator[TerrainMap]:
+        """
+        Generates the map level by level, yielding a TerrainMap per level.
+
+        Each level samples every `stride`-th point of the full coordinate
+        grid, so a coarse preview is available long before the full map.
+        The last stride should be 1, which yields exactly the map that
+        generate() returns for the same seed. Erosion only runs on that
+        level, so previews skip it.
+        """
+        self.stats = {}
+        seed, traps, ridges = self._place_features(width, height, seed)
+
+        for stride in strides:
+            total_map_float = self._generate_strided(
+                width, height, traps, ridges, stride
+            )
+            if stride == 1:
+                total_map_float = self._apply_erosion(total_map_float, seed)
+            normalized_map = self._normalize_to_255(total_map_float)
+            yield TerrainMap(normalized_map, seed=seed)
+
+    def _place_features(
+        self, width: int, height: int, seed: int | None
+    ) -> tuple[int, list[Feature], list[Feature]]:
+        """
+        Seeds the generator and places the traps and ridges. They are sampled
+        up front so the random stream doesn't depend on how the grid is
+        evaluated.
         """
         if seed is None:
             seed = random.randint(0, 1_000_000_000)
@@ -34,50 +157,144 @@ class MapGenerator:
         self.seed_x_offset = rng.uniform(0, 1000)
         self.seed_y_offset = rng.uniform(0, 1000)
 
-        # 1. Create a coordinate grid
-        xx, yy = np.meshgrid(
-            np.linspace(-5, 5, width), np.linspace(-5, 5, height), indexing="ij"
+        traps = self._sample_traps(width, height, rng)
+        ridges = self._sample_ridges(width, height, rng)
+        return seed, traps, ridges
+
+    def _generate_strided(
+        self,
+        width: int,
+        height: int,
+        traps: list[Feature],
+        ridges: list[Feature],
+        stride: int = 1,
+    ):
+        """
+        Generates the combined layers over every `stride`-th point of the
+        coordinate grid in a single pass.
+        """
+        points = slice(None, None, stride)
+        xx, yy = self._create_coordinate_grid(width, height, points, points)
+        # The domain warp is the same for every trap and ridge, so it is
+        # computed once per map and shared by all of them.
+        warped_grid = self._generate_warped_grid(xx, yy)
+        return self._combine_layers(xx, yy, warped_grid, traps, ridges)
+
+    def _create_coordinate_grid(
+        self, width: int, height: int, rows=slice(None), cols=slice(None)
+    ):
+        """
+        Creates the coordinate grid of the map, or of the (rows, cols) tile
+        or subsample of it. These hold exactly the same coordinates as the
+        full grid.
+        """
+        return np.meshgrid(
+            np.linspace(-5, 5, width)[rows],
+            np.linspace(-5, 5, height)[cols],
+            indexing="ij",
         )
 
-        # 2. Generate all noise layers
-        wide_map = self._generate_wide_variations(xx, yy, rng)
-        traps_map = self._generate_traps(xx, yy, width, height, rng)
-        ridges_map = self._generate_ridges(xx, yy, width, height, rng)
+    def _combine_layers(
+        self,
+        xx,
+        yy,
+        warped_grid: WarpedGrid,
+        traps: list[Feature],
+        ridges: list[Feature],
+    ):
+        """Generates every noise layer over a grid and adds them together."""
+        wide_map = self._generate_wide_variations(xx, yy)
+        traps_map = self._generate_traps(warped_grid, traps)
+        ridges_map = self._generate_ridges(xx, yy, warped_grid, ridges)
         detail_map = self._generate_detail_noise(xx, yy)
 
-        # 3. Combine all layers
-        total_map_float = wide_map + traps_map + ridges_map + detail_map
+        return wide_map + traps_map + ridges_map + detail_map
+
+    def _generate_tiled(
+        self,
+        width: int,
+        height: int,
+        traps: list[Feature],
+        ridges: list[Feature],
+        tile_size: int,
+        processes: int | None,
+    ):
+        """
+        Generates the combined layers tile by tile in a process pool.
 
-        # 4. Normalize the final map and create TerrainMap object
-        normalized_map = self._normalize_to_255(total_map_float)
+        Every layer is evaluated point by point, so tiles don't need to
+        overlap. The only map-wide input is the extent of the warped grid,
+        which decides the window of each feature; it is reduced from the
+        tiles in a first pass and handed to every tile in the second one.
+        """
+        tiles = [
+            (
+                slice(row, min(row + tile_size, width)),
+                slice(col, min(col + tile_size, height)),
+            )
+            for row in range(0, width, tile_size)
+            for col in range(0, height, tile_size)
+        ]
+        seed_offsets = (self.seed_x_offset, self.seed_y_offset)
+        jobs = [
+            (self.config_override, seed_offsets, width, height, rows, cols)
+            for rows, cols in tiles
+        ]
+
+        with Pool(processes) as pool:
+            tile_extents = pool.map(_tile_extents_worker, jobs)
+
+            x_min, x_max = np.full(width, np.inf), np.full(width, -np.inf)
+            y_min, y_max = np.full(height, np.inf), np.full(height, -np.inf)
+            for (rows, cols), extents in zip(tiles, tile_extents):
+                tile_x_min, tile_x_max, tile_y_min, tile_y_max = extents
+                np.minimum(x_min[rows], tile_x_min, out=x_min[rows])
+                np.maximum(x_max[rows], tile_x_max, out=x_max[rows])
+                np.minimum(y_min[cols], tile_y_min, out=y_min[cols])
+                np.maximum(y_max[cols], tile_y_max, out=y_max[cols])
+
+            map_extents = (x_min, x_max, y_min, y_max)
+            tile_maps = pool.map(
+                _tile_layers_worker,
+                [job + (map_extents, traps, ridges) for job in jobs],
+            )
 
-        return TerrainMap(normalized_map, seed=seed)
+        total_map_float = np.empty((width, height))
+        for (rows, cols), tile_map in zip(tiles, tile_maps):
+            total_map_float[rows, cols] = tile_map
+
+        return total_map_float
+
+    def _seeded_noise(self, points_x, points_y, octaves: int):
+        """
+        Evaluates Perlin noise over a grid of (already scaled) points,
+        shifted by the current seed offsets.
+        """
+        return pnoise2(
+            points_x + self.seed_x_offset,
+            points_y + self.seed_y_offset,
+            octaves=octaves,
+        )
 
-    def _generate_wide_variations(self, xx, yy, rng: random.Random):
+    def _generate_wide_variations(self, xx, yy):
         """Generates the base rolling hills."""
-        noise_map = np.zeros_like(xx)
         freq = self.config.WIDE_VARIATION_FREQUENCY
         amp = self.config.WIDE_VARIATION_AMPLITUDE
         octaves = self.config.WIDE_VARIATION_OCTAVES
 
-        it = np.nditer(
-            [xx, yy, noise_map], op_flags=[["readonly"], ["readonly"], ["writeonly"]]
-        )
-        for x, y, z_out in it:
-            z_out[...] = (
-                noise.pnoise2(
-                    float(x * freq) + self.seed_x_offset,
-                    float(y * freq) + self.seed_y_offset,
-                    octaves=octaves,
-                )
-                * amp
-            )
-        return noise_map
+        return self._seeded_noise(xx * freq, yy * freq, octaves) * amp
 
-    def _create_warped_gaussian(self, xx, yy, cx, cy, amplitude, width):
+    def _generate_warped_grid(
+        self,
+        xx,
+        yy,
+        extents: WarpExtents | None = None,
+        origin: tuple[int, int] = (0, 0),
+    ) -> WarpedGrid:
         """
-        Creates a single warped gaussian (positive or negative)
-        using C-accelerated noise calculation.
+        Displaces the coordinate grid with two noise fields (domain warping).
+        Returns the warped grid used to shape traps and ridges. When the grid
+        is a tile, `extents` and `origin` place it within the whole map.
         """
         warp_freq = self.config.BASIN_WARP_FREQUENCY
         warp_amp = self.config.BASIN_WARP_AMPLITUDE
@@ -88,124 +305,95 @@ class MapGenerator:
         warp_points_x_offset = (xx + 10.0) * warp_freq  # Offset para ruído Y
         warp_points_y_offset = (yy + 10.0) * warp_freq
 
-        x_warp_vals = np.zeros_like(xx)
-        y_warp_vals = np.zeros_like(yy)
-
-        it = np.nditer(
-            [
-                warp_points_x,
-                warp_points_y,
-                warp_points_x_offset,
-                warp_points_y_offset,
-                x_warp_vals,
-                y_warp_vals,
-            ],
-            op_flags=[
-                ["readonly"],
-                ["readonly"],
-                ["readonly"],
-                ["readonly"],
-                ["writeonly"],
-                ["writeonly"],
-            ],
+        x_warp_vals = (
+            self._seeded_noise(warp_points_x, warp_points_y, warp_octaves) * warp_amp
+        )
+        y_warp_vals = (
+            self._seeded_noise(warp_points_x_offset, warp_points_y_offset, warp_octaves)
+            * warp_amp
         )
 
-        for wx, wy, wxo, wyo, x_out, y_out in it:
-            x_out[...] = (
-                noise.pnoise2(
-                    float(wx) + self.seed_x_offset,
-                    float(wy) + self.seed_y_offset,
-                    octaves=warp_octaves,
-                )
-                * warp_amp
-            )
-            y_out[...] = (
-                noise.pnoise2(
-                    float(wxo) + self.seed_x_offset,
-                    float(wyo) + self.seed_y_offset,
-                    octaves=warp_octaves,
-                )
-                * warp_amp
-            )
-
-        xx_warped = xx + x_warp_vals
-        yy_warped = yy + y_warp_vals
+        return WarpedGrid(xx + x_warp_vals, yy + y_warp_vals, extents, origin)
 
+    def _create_warped_gaussian(
+        self, warped_grid: WarpedGrid, cx, cy, amplitude, width
+    ) -> tuple[np.ndarray, tuple[slice, slice]] | None:
+        """
+        Creates a single warped gaussian (positive or negative) over the
+        pre-computed warped coordinate grid.
+
+        The gaussian is only evaluated inside the window of the grid whose
+        warped coordinates fall within FEATURE_SUPPORT_WIDTHS widths of the
+        center. Every point left out is at least that far away, so it would
+        have received less than |amplitude| * exp(-FEATURE_SUPPORT_WIDTHS**2)
+        (about 1.1e-7 * |amplitude| at the default of 4 widths). That can
+        still tip a cell across a rounding boundary, so a few cells of a map
+        may differ by one level from the full evaluation once quantized.
+        Returns the values and the (rows, columns) window they belong to, or
+        None if the whole feature falls below that bound.
+        """
         safe_width_sq = max(width**2, 1e-6)
-        return amplitude * np.exp(
+        radius = self.config.FEATURE_SUPPORT_WIDTHS * np.sqrt(safe_width_sq)
+
+        window = warped_grid.window(cx, cy, radius)
+        if window is None:
+            return None
+
+        xx_warped = warped_grid.xx[window]
+        yy_warped = warped_grid.yy[window]
+        gaussian = amplitude * np.exp(
             -((xx_warped - cx) ** 2 + (yy_warped - cy) ** 2) / safe_width_sq
         )
+        return gaussian, window
 
-    def _generate_traps(self, xx, yy, width, height, rng: random.Random):
-        """Generates the trap layer (negative features)."""
+    def _sample_feature_center(self, rng: random.Random) -> tuple[float, float]:
+        """Picks the center of a trap or ridge."""
+        bias_strength = self.config.FEATURE_CENTER_BIAS_STRENGTH
+
+        if bias_strength > 0:
+            # Rejection sampling to bias placement towards the center
+            while True:
+                feature_x, feature_y = rng.uniform(-5, 5), rng.uniform(-5, 5)
+                # Normalize distance from center (0,0) to a [0, 1] range
+                # Max distance is from (0,0) to (5,5), which is sqrt(50)
+                dist_from_center = np.sqrt(feature_x**2 + feature_y**2)
+                normalized_dist = dist_from_center / np.sqrt(50)
+
+                # Probability of acceptance is higher closer to the center
+                # The strength parameter makes the falloff more or less aggressive
+                acceptance_prob = (1.0 - normalized_dist) ** bias_strength
+
+                if rng.random() < acceptance_prob:
+                    return feature_x, feature_y  # Accepted this position
+
+        # No bias, uniform placement
+        return rng.uniform(-5, 5), rng.uniform(-5, 5)
+
+    def _sample_traps(self, width, height, rng: random.Random) -> list[Feature]:
+        """Places the traps (negative features) of the map."""
         area = width * height
         num_traps_base = int(area * self.config.TRAP_DENSITY)
         num_traps = max(1, rng.randint(num_traps_base - 1, num_traps_base + 2))
 
-        traps_map = np.zeros_like(xx)
-
+        traps = []
         for _ in range(num_traps):
-            bias_strength = self.config.FEATURE_CENTER_BIAS_STRENGTH
-
-            if bias_strength > 0:
-                # Rejection sampling to bias placement towards the center
-                while True:
-                    trap_x, trap_y = rng.uniform(-5, 5), rng.uniform(-5, 5)
-                    # Normalize distance from center (0,0) to a [0, 1] range
-                    # Max distance is from (0,0) to (5,5), which is sqrt(50)
-                    dist_from_center = np.sqrt(trap_x**2 + trap_y**2)
-                    normalized_dist = dist_from_center / np.sqrt(50)
-
-                    # Probability of acceptance is higher closer to the center
-                    # The strength parameter makes the falloff more or less aggressive
-                    acceptance_prob = (1.0 - normalized_dist) ** bias_strength
-
-                    if rng.random() < acceptance_prob:
-                        break  # Accepted this position
-            else:
-                # No bias, uniform placement
-                trap_x, trap_y = rng.uniform(-5, 5), rng.uniform(-5, 5)
-
+            trap_x, trap_y = self._sample_feature_center(rng)
             depth = -rng.uniform(
                 self.config.TRAP_ABSOLUTE_DEPTH_MIN, self.config.TRAP_ABSOLUTE_DEPTH_MAX
             )
             width = rng.uniform(self.config.TRAP_WIDTH_MIN, self.config.TRAP_WIDTH_MAX)
+            traps.append((trap_x, trap_y, depth, width))
+        return traps
 
-            traps_map += self._create_warped_gaussian(
-                xx, yy, trap_x, trap_y, depth, width
-            )
-        return traps_map
-
-    def _generate_ridges(self, xx, yy, width, height, rng: random.Random):
-        """Generates the ridge layer (positive features)."""
+    def _sample_ridges(self, width, height, rng: random.Random) -> list[Feature]:
+        """Places the ridges (positive features) of the map."""
         area = width * height
         num_ridges_base = int(area * self.config.RIDGE_DENSITY)
         num_ridges = max(1, rng.randint(num_ridges_base - 1, num_ridges_base + 2))
 
-        ridges_map = np.zeros_like(xx)
-
+        ridges = []
         for _ in range(num_ridges):
-            bias_strength = self.config.FEATURE_CENTER_BIAS_STRENGTH
-
-            if bias_strength > 0:
-                # Rejection sampling to bias placement towards the center
-                while True:
-                    ridge_x, ridge_y = rng.uniform(-5, 5), rng.uniform(-5, 5)
-                    # Normalize distance from center (0,0) to a [0, 1] range
-                    # Max distance is from (0,0) to (5,5), which is sqrt(50)
-                    dist_from_center = np.sqrt(ridge_x**2 + ridge_y**2)
-                    normalized_dist = dist_from_center / np.sqrt(50)
-
-                    # Probability of acceptance is higher closer to the center
-                    # The strength parameter makes the falloff more or less aggressive
-                    acceptance_prob = (1.0 - normalized_dist) ** bias_strength
-
-                    if rng.random() < acceptance_prob:
-                        break  # Accepted this position
-            else:
-                # No bias, uniform placement
-                ridge_x, ridge_y = rng.uniform(-5, 5), rng.uniform(-5, 5)
-
+            ridge_x, ridge_y = self._sample_feature_center(rng)
             height_val = rng.uniform(
                 self.config.RIDGE_ABSOLUTE_HEIGHT_MIN,
                 self.config.RIDGE_ABSOLUTE_HEIGHT_MAX,
@@ -213,30 +401,45 @@ class MapGenerator:
             width = rng.uniform(
                 self.config.RIDGE_WIDTH_MIN, self.config.RIDGE_WIDTH_MAX
             )
+            ridges.append((ridge_x, ridge_y, height_val, width))
+        return ridges
 
-            ridge_base = self._create_warped_gaussian(
-                xx, yy, ridge_x, ridge_y, height_val, width
+    def _generate_traps(self, warped_grid: WarpedGrid, traps: list[Feature]):
+        """Generates the trap layer (negative features)."""
+        traps_map = np.zeros(warped_grid.shape)
+
+        for trap_x, trap_y, depth, width in traps:
+            trap = self._create_warped_gaussian(
+                warped_grid, trap_x, trap_y, depth, width
             )
+            if trap is None:
+                continue
+
+            trap_values, window = trap
+            traps_map[window] += trap_values
+        return traps_map
+
+    def _generate_ridges(self, xx, yy, warped_grid: WarpedGrid, ridges: list[Feature]):
+        """Generates the ridge layer (positive features)."""
+        ridges_map = np.zeros_like(xx)
 
-            ridge_texture_map = np.zeros_like(xx)
-            freq = self.config.RIDGE_FREQUENCY
-            amp = self.config.RIDGE_AMPLITUDE
-            octaves = self.config.RIDGE_OCTAVES
+        # The texture doesn't depend on the ridge, so every ridge shares it.
+        freq = self.config.RIDGE_FREQUENCY
+        amp = self.config.RIDGE_AMPLITUDE
+        octaves = self.config.RIDGE_OCTAVES
+        ridge_texture_map = self._seeded_noise(xx * freq, yy * freq, octaves)
 
-            it = np.nditer(
-                [xx, yy, ridge_texture_map],
-                op_flags=[["readonly"], ["readonly"], ["writeonly"]],
+        for ridge_x, ridge_y, height_val, width in ridges:
+            ridge = self._create_warped_gaussian(
+                warped_grid, ridge_x, ridge_y, height_val, width
             )
-            for x, y, z_out in it:
-                z_out[...] = noise.pnoise2(
-                    float(x * freq) + self.seed_x_offset,
-                    float(y * freq) + self.seed_y_offset,
-                    octaves=octaves,
-                )
+            if ridge is None:
+                continue
 
+            ridge_base, window = ridge
             ridge_mask = ridge_base > 0
-            ridge_with_texture = ridge_base * (1.0 + ridge_texture_map * amp)
-            ridges_map += np.where(ridge_mask, ridge_with_texture, ridge_base)
+            ridge_with_texture = ridge_base * (1.0 + ridge_texture_map[window] * amp)
+            ridges_map[window] += np.where(ridge_mask, ridge_with_texture, ridge_base)
 
         return ridges_map
 
@@ -245,33 +448,43 @@ class MapGenerator:
         if self.config.DETAIL_NOISE_AMPLITUDE == 0:
             return 0.0
 
-        noise_map = np.zeros_like(xx)
         freq = self.config.DETAIL_NOISE_FREQUENCY
         amp = self.config.DETAIL_NOISE_AMPLITUDE
         octaves = self.config.DETAIL_NOISE_OCTAVES
 
-        it = np.nditer(
-            [xx, yy, noise_map], op_flags=[["readonly"], ["readonly"], ["writeonly"]]
-        )
-        for x, y, z_out in it:
-            z_out[...] = (
-                noise.pnoise2(
-                    float(x * freq) + self.seed_x_offset,
-                    float(y * freq) + self.seed_y_offset,
-                    octaves=octaves,
-                )
-                * amp
-            )
-        return noise_map
+        return self._seeded_noise(xx * freq, yy * freq, octaves) * amp
 
-    def _normalize_to_255(self, data):
-        """Normalizes the map to a 0-255 uint8 range."""
+    def _apply_erosion(self, data, seed: int):
+        """
+        Runs the hydraulic erosion stage over the combined layers, if
+        enabled, with rain seeded from the map seed.
+        """
+        iterations = self.config.EROSION_ITERATIONS
         min_val = np.min(data)
-        max_val = np.max(data)
-
-        scale = max_val - min_val
-        if scale < 1e-9:
-            return np.full_like(data, 128, dtype=np.uint8)
+        scale = np.max(data) - min_val
+        if iterations <= 0 or scale < 1e-9:
+            self.stats["erosion_seconds"] = 0.0
+            return data
+
+        start = time.perf_counter()
+        # Erosion works on heights in [0, 1], so its settings don't depend
+        # on the amplitudes of the noise layers.
+        eroded = erode(
+            (data - min_val) / scale,
+            iterations,
+            rain_rate=self.config.EROSION_RAIN_RATE,
+            evaporation_rate=self.config.EROSION_EVAPORATION_RATE,
+            sediment_capacity=self.config.EROSION_SEDIMENT_CAPACITY,
+            erosion_rate=self.config.EROSION_PICKUP_RATE,
+            deposition_rate=self.config.EROSION_DEPOSITION_RATE,
+            rng=np.random.default_rng(seed),
+        )
+        self.stats["erosion_seconds"] = time.perf_counter() - start
+        return eroded
 
-        normalized = 255 * (data - min_val) / scale
-        return normalized.astype(np.uint8)
+    def _normalize_to_255(self, data):
+        """
+        Normalizes the map to a 0-255 range, quantized to the heightfield
+        storage dtype.
+        """
+        return normalize_to_255(data)
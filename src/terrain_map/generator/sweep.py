@@ -0,0 +1,95 @@
+import itertools
+import time
+from multiprocessing import Pool
+from terrain_map import TerrainMap
+from .generator_config import GeneratorConfig
+from .map_generator import MapGenerator
+
+
+class SweepRun:
+    """
+    The result of generating a single map during a parameter sweep: the
+    settings and seed it was generated with, how long generation took and
+    statistics of the resulting terrain and the generator's stage timings.
+    """
+
+    def __init__(
+        self,
+        config_override: dict,
+        seed: int,
+        seconds: float,
+        stats: dict[str, float],
+    ):
+        self.config_override = config_override
+        self.seed = seed
+        self.seconds = seconds
+        self.stats = stats
+
+
+def parameter_grid(**values: list) -> list[dict]:
+    """
+    Expands lists of values per setting into every combination of them, e.g.
+    parameter_grid(trap_density=[0.002, 0.004], ridge_octaves=[5, 7]) gives
+    four config overrides.
+    """
+    names = list(values)
+    return [
+        dict(zip(names, combination))
+        for combination in itertools.product(*values.values())
+    ]
+
+
+def terrain_statistics(terrain_map: TerrainMap) -> dict[str, float]:
+    """Summarizes the heights, steepness and memory footprint of a map."""
+    gradient_magnitude = terrain_map.gradient_magnitude
+    return {
+        "height_mean": float(terrain_map.height_data.mean()),
+        "height_std": float(terrain_map.height_data.std()),
+        "gradient_mean": float(gradient_magnitude.mean()),
+        "gradient_max": float(gradient_magnitude.max()),
+        "memory_mb": terrain_map.memory_bytes / 1024**2,
+    }
+
+
+def _sweep_worker(job) -> SweepRun:
+    """
+    Worker function to run in a process pool.
+    Generates and measures a single map of the sweep.
+    """
+    config_override, width, height, seed = job
+
+    generator = MapGenerator(config_override)
+    start = time.perf_counter()
+    terrain_map = generator.generate(width, height, seed=seed)
+    seconds = time.perf_counter() - start
+
+    stats = terrain_statistics(terrain_map) | generator.stats
+    return SweepRun(config_override, seed, seconds, stats)
+
+
+def run_sweep(
+    config_overrides: list[dict],
+    width: int,
+    height: int,
+    seeds: list[int],
+    processes: int | None = None,
+) -> list[SweepRun]:
+    """
+    Generates a map for every config override and seed in a pool of
+    `processes` worker processes (one per CPU by default). Returns a run per
+    map, in the order of the overrides and then of the seeds.
+
+    Every override is validated before any map is generated. Timings are
+    measured inside the workers, so they are comparable with each other as
+    long as the workers don't outnumber the CPUs.
+    """
+    for config_override in config_overrides:
+        GeneratorConfig(config_override)
+
+    jobs = [
+        (config_override, width, height, seed)
+        for config_override in config_overrides
+        for seed in seeds
+    ]
+    with Pool(processes) as pool:
+        return pool.map(_sweep_worker, jobs, chunksize=1)
@@ -0,0 +1,142 @@
+import json
+import os
+import struct
+import numpy as np
+from pathlib import Path
+from . import precision
+from .terrain_map import TerrainMap
+from .generator.generator_config import generator_config_hash
+
+# Binary map files start with a fixed-size header, followed by the heights
+# as a raw C-ordered (height, width) array in the storage dtype.
+MAGIC = b"GRADMAP\x00"
+VERSION = 1
+# magic, version, dtype, has seed, seed, width, height, config hash
+HEADER_FORMAT = "<8sH4sBqII12s"
+# Padded so the array starts on an aligned offset.
+HEADER_SIZE = 64
+FILE_SUFFIX = ".tmap"
+
+
+class MapHeader:
+    """The metadata stored at the start of a binary map file."""
+
+    def __init__(
+        self,
+        seed: int | None,
+        width: int,
+        height: int,
+        dtype: np.dtype,
+        config_hash: str,
+        version: int = VERSION,
+    ):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.dtype = np.dtype(dtype)
+        self.config_hash = config_hash
+        self.version = version
+
+    def pack(self) -> bytes:
+        header = struct.pack(
+            HEADER_FORMAT,
+            MAGIC,
+            self.version,
+            self.dtype.str.encode(),
+            self.seed is not None,
+            self.seed or 0,
+            self.width,
+            self.height,
+            self.config_hash.encode(),
+        )
+        return header.ljust(HEADER_SIZE, b"\x00")
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "MapHeader":
+        if len(data) < HEADER_SIZE or not data.startswith(MAGIC):
+            raise ValueError("Not a map file.")
+
+        _, version, dtype, has_seed, seed, width, height, config_hash = (
+            struct.unpack_from(HEADER_FORMAT, data)
+        )
+        if version > VERSION:
+            raise ValueError(
+                f"Map file version {version} is newer than the supported {VERSION}."
+            )
+
+        return cls(
+            seed if has_seed else None,
+            width,
+            height,
+            np.dtype(dtype.rstrip(b"\x00").decode()),
+            config_hash.rstrip(b"\x00").decode(),
+            version,
+        )
+
+
+def read_map_header(filepath: str | Path) -> MapHeader:
+    """Reads only the header of a binary map file."""
+    with open(filepath, "rb") as f:
+        return MapHeader.unpack(f.read(HEADER_SIZE))
+
+
+def save_map(terrain_map: TerrainMap, filepath: str | Path):
+    """
+    Saves a map to a binary map file, with its heights in the storage dtype.
+    """
+    height_data = precision.to_storage(terrain_map.height_data)
+    header = MapHeader(
+        terrain_map.seed,
+        terrain_map.width,
+        terrain_map.height,
+        height_data.dtype,
+        generator_config_hash(),
+    )
+
+    # Write to a temporary file first so a crash never leaves a
+    # half-written map behind.
+    temp_path = Path(filepath).with_suffix(".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(header.pack())
+        np.ascontiguousarray(height_data).tofile(f)
+    os.replace(temp_path, filepath)
+
+
+def load_map(filepath: str | Path) -> TerrainMap:
+    """
+    Loads a map from a binary map file. The heights are memory-mapped, so
+    they are read straight into the map's working array without any parsing.
+    """
+    header = read_map_header(filepath)
+
+    expected_size = HEADER_SIZE + header.width * header.height * header.dtype.itemsize
+    if os.path.getsize(filepath) < expected_size:
+        raise ValueError("Map file is truncated.")
+
+    height_data = np.memmap(
+        filepath,
+        dtype=header.dtype,
+        mode="r",
+        offset=HEADER_SIZE,
+        shape=(header.height, header.width),
+    )
+    # A plain array view, so the map's own copy isn't a memmap too.
+    return TerrainMap(np.asarray(height_data), seed=header.seed)
+
+
+def save_map_json(terrain_map: TerrainMap, filepath: str | Path):
+    """
+    Exports a map to JSON, with its heights rounded to whole 0-255 values.
+    """
+    height_data = np.clip(np.rint(terrain_map.height_data), 0, 255).astype(int)
+    with open(filepath, "w") as f:
+        json.dump({"seed": terrain_map.seed, "height_data": height_data.tolist()}, f)
+
+
+def load_map_json(filepath: str | Path) -> TerrainMap:
+    """Imports a map exported to JSON."""
+    with open(filepath, "r") as f:
+        map_data = json.load(f)
+
+    height_data = np.array(map_data["height_data"], dtype=np.uint8)
+    return TerrainMap(height_data, seed=map_data.get("seed"))
@@ -0,0 +1,95 @@
+import numpy as np
+from config import config
+
+# Heights are always on a 0-255 scale in gameplay code. The storage dtype
+# decides how finely generated maps are quantized to that scale (and how
+# they are cached), and the working dtype is what TerrainMap, its gradients
+# and the tools compute with.
+STORAGE_DTYPES = ("uint8", "uint16", "float32")
+WORKING_DTYPES = ("float32", "float64")
+
+MAX_HEIGHT = 255.0
+
+
+def _checked_dtype(name: str, allowed: tuple[str, ...], setting: str) -> np.dtype:
+    if name not in allowed:
+        raise ValueError(
+            f"Unsupported heightfield {setting} '{name}'. "
+            f"Expected one of: {', '.join(allowed)}."
+        )
+    return np.dtype(name)
+
+
+def storage_dtype() -> np.dtype:
+    """The dtype generated maps are quantized to and stored as."""
+    return _checked_dtype(
+        config.HEIGHTFIELD.STORAGE_DTYPE, STORAGE_DTYPES, "storage dtype"
+    )
+
+
+def working_dtype() -> np.dtype:
+    """The dtype maps are edited and analysed in."""
+    return _checked_dtype(
+        config.HEIGHTFIELD.WORKING_DTYPE, WORKING_DTYPES, "working dtype"
+    )
+
+
+def _levels(dtype: np.dtype) -> float:
+    """The stored value of the highest height, MAX_HEIGHT, for a dtype."""
+    if np.issubdtype(dtype, np.integer):
+        return float(np.iinfo(dtype).max)
+    return MAX_HEIGHT
+
+
+def height_scale(dtype: np.dtype) -> float:
+    """The 0-255 height of one stored unit of a dtype."""
+    return MAX_HEIGHT / _levels(np.dtype(dtype))
+
+
+def quantize(heights: np.ndarray) -> np.ndarray:
+    """
+    Stores 0-255 heights in the storage dtype, truncating to the stored
+    value below. Integer dtypes spread the range over all their values.
+    """
+    dtype = storage_dtype()
+    return (heights * (_levels(dtype) / MAX_HEIGHT)).astype(dtype)
+
+
+def to_working(stored: np.ndarray) -> np.ndarray:
+    """
+    Converts stored heights of any supported dtype to 0-255 heights in the
+    working dtype. The result is always a new array.
+    """
+    dtype = working_dtype()
+    scale = height_scale(stored.dtype)
+    if scale == 1.0:
+        return stored.astype(dtype)
+    return stored.astype(dtype) * dtype.type(scale)
+
+
+def to_storage(heights: np.ndarray) -> np.ndarray:
+    """
+    Converts 0-255 working heights back to the storage dtype, rounding to
+    the nearest stored value.
+    """
+    dtype = storage_dtype()
+    stored = heights * (_levels(dtype) / MAX_HEIGHT)
+    if np.issubdtype(dtype, np.integer):
+        stored = np.clip(np.rint(stored), 0, _levels(dtype))
+    return stored.astype(dtype)
+
+
+def normalize_to_255(data: np.ndarray) -> np.ndarray:
+    """
+    Stretches raw heights of any unit to the full 0-255 range and quantizes
+    them to the storage dtype. Flat data becomes a uniform height of 128.
+    """
+    min_val = np.min(data)
+    max_val = np.max(data)
+
+    scale = max_val - min_val
+    if scale < 1e-9:
+        return quantize(np.full_like(data, 128.0))
+
+    normalized = 255 * (data - min_val) / scale
+    return quantize(normalized)
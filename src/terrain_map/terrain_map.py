@@ -1,22 +1,31 @@
 import numpy as np
 from scipy.ndimage import sobel
+from . import precision
 from .tools import ExcavatorTool, FillerTool, GraderTool
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .tools import TerrainTool
+
+
 class TerrainMap:
     """
     Holds the 2D height data for the terrain and provides
     pre-calculated gradient maps for pathfinding cost analysis.
     Also manages terraforming tool application.
+
+    The gradients and their magnitude (the steepness) are kept as rasters
+    the size of the map, and edits only recalculate them around the cells
+    they changed.
     """
 
     def __init__(self, height_data: np.ndarray, seed: int | None = None):
         """
-        Initializes the map with 2D height data (0-255).
+        Initializes the map with 2D height data, stored in any of the
+        supported storage dtypes. Heights are converted to the 0-255 scale
+        in the working dtype.
         """
-        self.height_data: np.ndarray = height_data.astype(float)
+        self.height_data: np.ndarray = precision.to_working(height_data)
         self.seed = seed
         self.height, self.width = height_data.shape
 
@@ -27,18 +36,70 @@ class TerrainMap:
             "grader": GraderTool(),
         }
 
+        # The (rows, cols) region modified by every edit, in order, so views
+        # of the map can update just what changed since they last looked.
+        self.edits: list[tuple[slice, slice]] = []
+
         # Pre-calculate gradient maps
         self._calculate_gradients()
 
     def _calculate_gradients(self):
         """
         Uses a Sobel filter to calculate the partial derivatives (gradient)
-        of the terrain, storing them in gradient_x and gradient_y.
+        of the terrain, storing them in gradient_x and gradient_y, and their
+        magnitude in gradient_magnitude.
         """
         # gradient_y corresponds to df/dy (changes along axis 0).
         self.gradient_y = sobel(self.height_data, axis=0)
         # gradient_x corresponds to df/dx (changes along axis 1).
         self.gradient_x = sobel(self.height_data, axis=1)
+        self.gradient_magnitude = np.hypot(self.gradient_x, self.gradient_y)
+
+    def gradient_region(self, rows: slice, cols: slice) -> tuple[slice, slice]:
+        """
+        Returns the (rows, cols) region whose gradients depend on the heights
+        of a region. The Sobel filter is 3x3, so it reaches one cell further
+        on every side, clipped to the map.
+        """
+        return (
+            slice(max(rows.start - 1, 0), min(rows.stop + 1, self.height)),
+            slice(max(cols.start - 1, 0), min(cols.stop + 1, self.width)),
+        )
+
+    def _update_gradients(self, rows: slice, cols: slice):
+        """
+        Recalculates only the gradients that depend on the heights of a
+        (rows, cols) region, after they changed. The filter runs over just
+        enough heights around them to give the same values as filtering
+        the whole map.
+        """
+        out_rows, out_cols = self.gradient_region(rows, cols)
+        in_rows, in_cols = self.gradient_region(out_rows, out_cols)
+        heights = self.height_data[in_rows, in_cols]
+        inner = (
+            slice(out_rows.start - in_rows.start, out_rows.stop - in_rows.start),
+            slice(out_cols.start - in_cols.start, out_cols.stop - in_cols.start),
+        )
+
+        gradient_y = sobel(heights, axis=0)[inner]
+        gradient_x = sobel(heights, axis=1)[inner]
+        self.gradient_y[out_rows, out_cols] = gradient_y
+        self.gradient_x[out_rows, out_cols] = gradient_x
+        self.gradient_magnitude[out_rows, out_cols] = np.hypot(gradient_x, gradient_y)
+
+    @property
+    def memory_bytes(self) -> int:
+        """The memory held by the height data and the gradient maps."""
+        return (
+            self.height_data.nbytes
+            + self.gradient_x.nbytes
+            + self.gradient_y.nbytes
+            + self.gradient_magnitude.nbytes
+        )
+
+    def contains(self, px: int, py: int) -> bool:
+        """Whether a pixel coordinate lies on the map."""
+        return 0 <= px < self.width and 0 <= py < self.height
 
     def get_height_at(self, px: int, py: int) -> float:
         """Gets the height at a specific pixel coordinate."""
@@ -48,18 +109,17 @@ class TerrainMap:
 
     def get_gradient_magnitude_at(self, px: int, py: int) -> float:
         """
-        Calculates the gradient magnitude (steepness) at a pixel, which is
-        used as the core of the A* pathfinding cost.
+        Gets the gradient magnitude (steepness) at a pixel, which is used as
+        the core of the A* pathfinding cost.
         """
         if 0 <= px < self.width and 0 <= py < self.height:
-            gx = self.gradient_x[py, px]
-            gy = self.gradient_y[py, px]
-            return np.sqrt(gx**2 + gy**2)
+            return self.gradient_magnitude[py, px]
         return np.inf  # Out-of-bounds is infinitely expensive
 
     def apply_tool(self, tool_type: str, center_x: int, center_y: int) -> bool:
         """
-        Applies a tool's effect and recalculates gradients if the map was modified.
+        Applies a tool's effect and recalculates the gradients around it if the
+        map was modified.
         Returns True if the modification was successful.
         """
         tool = self._tools.get(tool_type)
@@ -70,8 +130,10 @@ class TerrainMap:
         modified = tool.apply(self, center_x, center_y)
 
         if modified:
+            region = tool.affected_region(self, center_x, center_y)
+            self.edits.append(region)
             # Gradients must be recalculated after any terrain modification.
-            self._calculate_gradients()
+            self._update_gradients(*region)
             return True
 
         return False
@@ -38,5 +38,6 @@ class ExcavatorTool(TerrainTool):
         terrain_map.height_data[y_slice, x_slice][mask] -= self.depth * falloff
 
         # Ensure height remains non-negative
-        np.clip(terrain_map.height_data, 0, None, out=terrain_map.height_data)
+        aoe_height_data = terrain_map.height_data[y_slice, x_slice]
+        np.clip(aoe_height_data, 0, None, out=aoe_height_data)
         return True
@@ -27,21 +27,31 @@ class TerrainTool:
             "The 'apply' method must be implemented by derived tool classes."
         )
 
-    def _get_area_mask(
+    def affected_region(
         self, terrain_map: "TerrainMap", center_x: int, center_y: int
-    ) -> tuple[np.ndarray, slice, slice]:
+    ) -> tuple[slice, slice]:
         """
-        Calculates the mask for the circular area of effect (AoE) and
-        returns the slice indices for the affected region.
+        Returns the (rows, cols) slices of the rectangle bounding the area of
+        effect, clipped to the map. No cell outside it is ever modified.
         """
         y_min = max(0, center_y - self.radius)
         y_max = min(terrain_map.height, center_y + self.radius + 1)
         x_min = max(0, center_x - self.radius)
         x_max = min(terrain_map.width, center_x + self.radius + 1)
+        return slice(y_min, y_max), slice(x_min, x_max)
+
+    def _get_area_mask(
+        self, terrain_map: "TerrainMap", center_x: int, center_y: int
+    ) -> tuple[np.ndarray, slice, slice]:
+        """
+        Calculates the mask for the circular area of effect (AoE) and
+        returns the slice indices for the affected region.
+        """
+        y_slice, x_slice = self.affected_region(terrain_map, center_x, center_y)
 
         # Create coordinates grid for the sliced area
-        Y, X = np.ogrid[y_min:y_max, x_min:x_max]
+        Y, X = np.ogrid[y_slice, x_slice]
         dist_squared = (X - center_x) ** 2 + (Y - center_y) ** 2
 
         mask = dist_squared <= self.radius**2
-        return mask, slice(y_min, y_max), slice(x_min, x_max)
+        return mask, y_slice, x_slice